@@ -0,0 +1,113 @@
+from pathlib import Path
+from typing import Dict, Optional
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import shutil
+import stat
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.compression import brotli, choose_encoding
+
+logger_instance = logging.getLogger(__name__)
+
+STATIC_DIRECTORY = Path(__file__).resolve().parent / "static"
+ASSETS_BUILD_DIRECTORY_NAME = "dist"
+ASSETS_MANIFEST_NAME = "manifest.json"
+PRECOMPRESSED_SUFFIXES = {".css", ".js", ".svg", ".html", ".json", ".txt"}
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+PRECOMPRESSED_ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+
+def build_static_assets(static_directory: Path = STATIC_DIRECTORY) -> Dict[str, str]:
+    build_directory = static_directory / ASSETS_BUILD_DIRECTORY_NAME
+    shutil.rmtree(build_directory, ignore_errors=True)
+
+    assets_manifest = {}
+    for source_path in sorted(static_directory.rglob("*")):
+        if not source_path.is_file():
+            continue
+        relative_path = source_path.relative_to(static_directory)
+        content = source_path.read_bytes()
+        content_hash = hashlib.blake2b(content, digest_size=6).hexdigest()
+        hashed_path = relative_path.with_name(f"{relative_path.stem}.{content_hash}{relative_path.suffix}")
+
+        target_path = build_directory / hashed_path
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path.write_bytes(content)
+        if relative_path.suffix in PRECOMPRESSED_SUFFIXES:
+            target_path.with_name(target_path.name + ".gz").write_bytes(gzip.compress(content, 9, mtime=0))
+            if brotli is not None:
+                target_path.with_name(target_path.name + ".br").write_bytes(brotli.compress(content, quality=11))
+
+        assets_manifest[relative_path.as_posix()] = f"{ASSETS_BUILD_DIRECTORY_NAME}/{hashed_path.as_posix()}"
+
+    (build_directory / ASSETS_MANIFEST_NAME).write_text(json.dumps(assets_manifest, indent=2, sort_keys=True))
+    return assets_manifest
+
+
+def load_assets_manifest(static_directory: Path = STATIC_DIRECTORY) -> Dict[str, str]:
+    manifest_path = static_directory / ASSETS_BUILD_DIRECTORY_NAME / ASSETS_MANIFEST_NAME
+    try:
+        return json.loads(manifest_path.read_text())
+    except FileNotFoundError:
+        logger_instance.warning("Статика не собрана, отдаем файлы без хэшей: python -m app.assets")
+        return {}
+
+
+assets_manifest: Optional[Dict[str, str]] = None
+
+
+def static_url(asset_path: str) -> str:
+    global assets_manifest
+    if assets_manifest is None:
+        assets_manifest = load_assets_manifest()
+    return f"/static/{assets_manifest.get(asset_path, asset_path)}"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        is_hashed_asset = Path(path).parts[:1] == (ASSETS_BUILD_DIRECTORY_NAME,)
+        if is_hashed_asset:
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            available_encodings = list(PRECOMPRESSED_ENCODINGS)
+            while True:
+                encoding_name = choose_encoding(accept_encoding, available_encodings)
+                if encoding_name is None:
+                    break
+                available_encodings.remove(encoding_name)
+                full_path, stat_result = await anyio.to_thread.run_sync(
+                    self.lookup_path, path + PRECOMPRESSED_ENCODINGS[encoding_name]
+                )
+                if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                    response = FileResponse(
+                        full_path,
+                        stat_result=stat_result,
+                        media_type=mimetypes.guess_type(path)[0] or "application/octet-stream",
+                        headers={"Content-Encoding": encoding_name}
+                    )
+                    response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+                    response.headers["Vary"] = "Accept-Encoding"
+                    return response
+
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if is_hashed_asset else "no-cache"
+            if is_hashed_asset:
+                response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+
+if __name__ == "__main__":
+    built_manifest = build_static_assets()
+    for original_path, hashed_path in built_manifest.items():
+        print(f"{original_path} -> {hashed_path}")
+    print(f"Собрано файлов: {len(built_manifest)}{'' if brotli is not None else ' (без .br: нет пакета brotli)'}")
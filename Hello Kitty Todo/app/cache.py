@@ -0,0 +1,213 @@
+from collections import OrderedDict
+from typing import Optional, Any, Callable
+import hashlib
+import logging
+import multiprocessing
+import secrets
+import threading
+import time
+
+import redis
+import redis.asyncio
+from prometheus_client import Counter
+
+from app.config import app_settings
+
+logger_instance = logging.getLogger(__name__)
+
+CACHE_KEY_VERSION = "v1"
+CACHE_KEY_PREFIX = f"kitty:{CACHE_KEY_VERSION}"
+LIST_CACHE_TTL_SECONDS = 300
+
+L1_CACHE_EVENTS = Counter('kitty_l1_cache_events_total', 'In-process L1 cache events', ['event'])
+
+
+def build_etag(cache_key: str) -> str:
+    # Ключ уже содержит поколение записей и параметры запроса,
+    # поэтому ETag меняется ровно тогда, когда меняется ответ.
+    return f'W/"{hashlib.blake2b(cache_key.encode(), digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    weak_etag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == weak_etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+class LocalLRUCache:
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                L1_CACHE_EVENTS.labels(event="miss").inc()
+                return None
+            expires_at, payload = entry
+            if expires_at <= self.clock():
+                del self._entries[cache_key]
+                L1_CACHE_EVENTS.labels(event="miss").inc()
+                return None
+            self._entries.move_to_end(cache_key)
+            L1_CACHE_EVENTS.labels(event="hit").inc()
+            return payload
+
+    def set(self, cache_key: str, payload: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[cache_key] = (self.clock() + self.ttl_seconds, payload)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                L1_CACHE_EVENTS.labels(event="eviction").inc()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+
+    def __init__(self, local_cache: LocalLRUCache, redis_client: Optional[redis.asyncio.Redis] = None):
+        self.local_cache = local_cache
+        self.redis_client = redis_client
+        # Без Redis поколение живет в разделяемой памяти: воркеры gunicorn
+        # (run_kitty.py, preload_app) наследуют его от мастера и видят записи друг друга.
+        self.shared_generation = multiprocessing.Value("q", 0)
+        # Локальное поколение после рестарта снова начинается с нуля, поэтому в ключ
+        # входит метка запуска: иначе старый ETag клиента совпал бы с новыми данными
+        self.boot_id = secrets.token_hex(4)
+        # Записи, чей INCR не дошел до Redis; общие для воркеров, как и поколение
+        self.pending_generation_bumps = multiprocessing.Value("q", 0)
+
+    @property
+    def local_generation(self) -> int:
+        return self.shared_generation.value
+
+    @property
+    def local_generation_token(self) -> str:
+        # Отдельное пространство имен, чтобы не совпасть с поколением из Redis
+        return f"l{self.boot_id}:{self.local_generation}"
+
+    def bump_local_generation(self) -> None:
+        with self.shared_generation.get_lock():
+            self.shared_generation.value += 1
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.redis_client is not None
+
+    def attach(self, redis_client: Optional[redis.asyncio.Redis]) -> None:
+        self.redis_client = redis_client
+        self.local_cache.clear()
+
+    def detach(self) -> None:
+        self.redis_client = None
+        self.local_cache.clear()
+
+    @staticmethod
+    def build_list_key(generation_token: str, *key_parts: Any) -> str:
+        return ":".join([CACHE_KEY_PREFIX, "tasks", generation_token, *(str(part) for part in key_parts)])
+
+    @staticmethod
+    def build_generation_key() -> str:
+        return f"{CACHE_KEY_PREFIX}:tasks-generation"
+
+    async def flush_pending_generation_bumps(self) -> bool:
+        pending_bumps = self.pending_generation_bumps.value
+        if pending_bumps == 0:
+            return True
+        try:
+            await self.redis_client.incr(self.build_generation_key())
+        except redis.RedisError as error:
+            logger_instance.warning(f"Поколение кэша в Redis все еще отстает от записей: {error}")
+            return False
+        with self.pending_generation_bumps.get_lock():
+            self.pending_generation_bumps.value -= pending_bumps
+        return True
+
+    async def get_list_generation(self) -> str:
+        if not self.is_enabled:
+            return self.local_generation_token
+        # Пока поколение в Redis не сдвинуто после записи, страницы под ним устарели:
+        # работаем на локальном поколении, а не отдаем их до конца TTL
+        if not await self.flush_pending_generation_bumps():
+            return self.local_generation_token
+        generation_key = self.build_generation_key()
+        cached_generation = self.local_cache.get(generation_key)
+        if cached_generation is not None:
+            return f"g{int(cached_generation)}"
+        local_generation_before = self.local_generation
+        try:
+            generation = await self.redis_client.get(generation_key)
+        except redis.RedisError as error:
+            logger_instance.warning(f"Ошибка чтения поколения кэша: {error}")
+            return self.local_generation_token
+        generation = generation if generation is not None else b"0"
+        # Запись, прошедшая во время await, уже очистила L1: прочитанное поколение
+        # могло устареть, и сохранять его нельзя, иначе L1 вернет его до конца TTL
+        if self.local_generation == local_generation_before:
+            self.local_cache.set(generation_key, generation)
+        return f"g{int(generation)}"
+
+    async def current_list_key(self, *key_parts: Any) -> str:
+        return self.build_list_key(await self.get_list_generation(), *key_parts)
+
+    async def get_bytes(self, cache_key: str) -> Optional[bytes]:
+        payload = self.local_cache.get(cache_key)
+        if payload is not None or not self.is_enabled:
+            return payload
+        try:
+            payload = await self.redis_client.get(cache_key)
+        except redis.RedisError as error:
+            logger_instance.warning(f"Ошибка чтения из кэша {cache_key}: {error}")
+            return None
+        if payload is not None:
+            self.local_cache.set(cache_key, payload)
+        return payload
+
+    async def set_bytes(self, cache_key: str, payload: bytes, ttl_seconds: int = LIST_CACHE_TTL_SECONDS) -> None:
+        self.local_cache.set(cache_key, payload)
+        if not self.is_enabled:
+            return
+        try:
+            await self.redis_client.setex(cache_key, ttl_seconds, payload)
+        except redis.RedisError as error:
+            logger_instance.warning(f"Ошибка записи в кэш {cache_key}: {error}")
+
+    async def invalidate_task_lists(self) -> None:
+        # Старые страницы не удаляются: ключи с прошлым поколением
+        # больше никто не читает, и они сами истекают по TTL.
+        # Отдельные задачи и статистика лежат под тем же поколением, поэтому один incr покрывает все.
+        # L1 других процессов догоняет запись не позже чем через свой TTL.
+        self.bump_local_generation()
+        self.local_cache.clear()
+        if not self.is_enabled:
+            return
+        try:
+            await self.redis_client.incr(self.build_generation_key())
+        except redis.RedisError as error:
+            logger_instance.warning(f"Ошибка инвалидации списков задач, повторим при следующем чтении: {error}")
+            with self.pending_generation_bumps.get_lock():
+                self.pending_generation_bumps.value += 1
+
+
+response_cache_instance = ResponseCache(
+    LocalLRUCache(app_settings.l1_cache_max_entries, app_settings.l1_cache_ttl_seconds)
+)
@@ -0,0 +1,138 @@
+from typing import List, Optional
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_MINIMUM_SIZE = 1000
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream", "image/", "audio/", "video/")
+
+
+def parse_accepted_encodings(accept_encoding: str) -> List[str]:
+    accepted_encodings = []
+    for encoding_entry in accept_encoding.split(","):
+        encoding_name, _, parameters = encoding_entry.strip().partition(";")
+        quality = 1.0
+        if parameters.strip().startswith("q="):
+            try:
+                quality = float(parameters.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if encoding_name and quality > 0:
+            accepted_encodings.append(encoding_name.strip().lower())
+    return accepted_encodings
+
+
+def choose_encoding(accept_encoding: str, available_encodings: Optional[List[str]] = None) -> Optional[str]:
+    accepted_encodings = parse_accepted_encodings(accept_encoding)
+    if available_encodings is None:
+        available_encodings = ["br", "gzip"] if brotli is not None else ["gzip"]
+    for encoding_name in available_encodings:
+        if encoding_name in accepted_encodings:
+            return encoding_name
+    return None
+
+
+class StreamCompressor:
+
+    def __init__(self, encoding_name: str):
+        self.encoding_name = encoding_name
+        if encoding_name == "br":
+            self.compressor = brotli.Compressor(quality=4)
+        else:
+            self.compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, finish: bool) -> bytes:
+        if self.encoding_name == "br":
+            compressed = self.compressor.process(data)
+            return compressed + (self.compressor.finish() if finish else self.compressor.flush())
+        compressed = self.compressor.compress(data)
+        return compressed + self.compressor.flush(zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding_name = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding_name is None:
+            await self.app(scope, receive, send)
+            return
+        await CompressionResponder(self.app, encoding_name, self.minimum_size)(scope, receive, send)
+
+
+class CompressionResponder:
+
+    def __init__(self, app: ASGIApp, encoding_name: str, minimum_size: int):
+        self.app = app
+        self.encoding_name = encoding_name
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.compressor: Optional[StreamCompressor] = None
+        self.passthrough = False
+        self.started = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Starlette сравнивает имена заголовков в нижнем регистре, а смонтированные
+            # приложения (например, /metrics) могут прислать "Content-Encoding"
+            message["headers"] = [(name.lower(), value) for name, value in message.get("headers", [])]
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "")
+            # Уже сжатые ответы (статика с .br/.gz) и потоки SSE отдаем как есть
+            self.passthrough = "content-encoding" in headers or media_type.startswith(UNCOMPRESSED_MEDIA_TYPES)
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+            self.compressor = StreamCompressor(self.encoding_name)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.encoding_name
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers and not headers["etag"].startswith("W/"):
+                headers["ETag"] = f"W/{headers['etag']}"
+            compressed_body = self.compressor.compress(body, finish=not more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed_body))
+            await self.send(self.initial_message)
+            await self.send({"type": "http.response.body", "body": compressed_body, "more_body": more_body})
+            return
+
+        if self.compressor is None:
+            await self.send(message)
+            return
+        await self.send({
+            "type": "http.response.body",
+            "body": self.compressor.compress(body, finish=not more_body),
+            "more_body": more_body,
+        })
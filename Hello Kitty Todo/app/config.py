@@ -24,11 +24,28 @@ class AppSettings(BaseSettings):
     ribbon_color: str = "#FF1493"
 
     database_url: str = "sqlite:///./data/kitty_tasks.db"
+    database_async_mode: bool = False
+    sqlite_pragma_profile: str = "performance"
 
     redis_host: str = "redis"
     redis_port: int = 6379
     redis_db: int = 0
     redis_password: Optional[str] = "kitty_password"
+    redis_max_connections: int = 50
+    redis_connect_timeout_seconds: float = 1.0
+    redis_socket_timeout_seconds: float = 0.5
+
+    l1_cache_max_entries: int = 256
+    l1_cache_ttl_seconds: float = 2.0
+
+    health_probe_interval_seconds: float = 10.0
+
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int = 1
+    server_graceful_timeout_seconds: int = 30
+    server_max_requests: int = 0
+    prometheus_multiproc_dir: str = "/tmp/kitty_prometheus"
 
     enable_kitty_sounds: bool = True
     kitty_emoji: str = "🐱🎀🌸"
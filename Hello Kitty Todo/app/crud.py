@@ -1,10 +1,61 @@
+import asyncio
+import random
+from sqlalchemy import update, insert, delete, select, text, func, Row
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.models import TaskModel, TaskStatus, KittyCategory
-from typing import Optional, List
+from starlette.concurrency import run_in_threadpool
+from app.models import TaskModel, TaskStatus, KittyCategory, TaskCounterModel, TASK_SEARCH_TABLE
+from typing import Optional, List, Union, Callable, Any, Iterator, AsyncIterator, Sequence
+from datetime import timezone
 import logging
 
 logger_instance = logging.getLogger(__name__)
 
+TASKS_COUNTER_NAME = "tasks"
+
+SQLITE_WRITE_RETRY_ATTEMPTS = 5
+SQLITE_WRITE_RETRY_BASE_DELAY_SECONDS = 0.05
+
+TASK_SORT_ORDERS = {
+    "id": (TaskModel.id.asc(),),
+    "-id": (TaskModel.id.desc(),),
+    "created_at": (TaskModel.created_at.asc(), TaskModel.id.asc()),
+    "-created_at": (TaskModel.created_at.desc(), TaskModel.id.desc()),
+    "priority": (TaskModel.priority.asc(), TaskModel.id.asc()),
+    "-priority": (TaskModel.priority.desc(), TaskModel.id.desc()),
+}
+
+
+TASK_ROW_COLUMNS = (
+    TaskModel.id,
+    TaskModel.title,
+    TaskModel.description,
+    TaskModel.status,
+    TaskModel.category,
+    TaskModel.priority,
+    TaskModel.created_at,
+    TaskModel.completed_at,
+)
+TASK_COLUMNS_BY_NAME = {column.key: column for column in TASK_ROW_COLUMNS}
+
+
+def build_search_expression(search_query: str) -> str:
+    terms = [term.replace('"', '""') for term in search_query.split()]
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def select_task_columns(fields: Optional[Sequence[str]] = None) -> Sequence[Any]:
+    if not fields:
+        return TASK_ROW_COLUMNS
+    return [TASK_COLUMNS_BY_NAME[field_name] for field_name in fields]
+
+
+def to_naive_utc(moment):
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 class TaskCRUD:
 
@@ -23,6 +74,7 @@ class TaskCRUD:
                 priority=getattr(validated_data, 'priority', 3)
             )
             database_session.add(db_task_instance)
+            TaskCRUD.adjust_task_counter(database_session, 1)
             database_session.commit()
             database_session.refresh(db_task_instance)
             logger_instance.info(f"Создана задача с ID: {db_task_instance.id}")
@@ -32,6 +84,32 @@ class TaskCRUD:
             logger_instance.error(f"Ошибка создания задачи: {error}")
             raise
 
+    @staticmethod
+    def create_tasks_bulk(database_session: Session, tasks_data: List[dict]) -> List[int]:
+        try:
+            rows = [
+                {
+                    "title": task_data["title"],
+                    "description": task_data.get("description"),
+                    "status": TaskStatus(task_data["status"]),
+                    "category": KittyCategory(task_data.get("category") or KittyCategory.FUN.value),
+                    "priority": task_data.get("priority", 3),
+                }
+                for task_data in tasks_data
+            ]
+            created_ids = database_session.scalars(
+                insert(TaskModel).returning(TaskModel.id, sort_by_parameter_order=True),
+                rows
+            ).all()
+            TaskCRUD.adjust_task_counter(database_session, len(created_ids))
+            database_session.commit()
+            logger_instance.info(f"Создано задач пакетом: {len(created_ids)}")
+            return list(created_ids)
+        except Exception as error:
+            database_session.rollback()
+            logger_instance.error(f"Ошибка пакетного создания задач: {error}")
+            raise
+
     @staticmethod
     def get_task_by_id(database_session: Session, task_id: int) -> Optional[TaskModel]:
         try:
@@ -41,13 +119,112 @@ class TaskCRUD:
             raise
 
     @staticmethod
-    def get_all_tasks(database_session: Session, skip: int = 0, limit: int = 100) -> List[TaskModel]:
+    def get_task_row(
+            database_session: Session,
+            task_id: int,
+            fields: Optional[Sequence[str]] = None
+    ) -> Optional[Row]:
+        try:
+            return database_session.execute(
+                select(*select_task_columns(fields)).where(TaskModel.id == task_id)
+            ).first()
+        except Exception as error:
+            logger_instance.error(f"Ошибка получения задачи {task_id}: {error}")
+            raise
+
+    @staticmethod
+    def get_all_tasks(
+            database_session: Session,
+            skip: int = 0,
+            limit: int = 100,
+            filters: Optional[dict] = None,
+            sort: str = "id",
+            fields: Optional[Sequence[str]] = None
+    ) -> List[Row]:
         try:
-            return database_session.query(TaskModel).offset(skip).limit(limit).all()
+            return database_session.execute(
+                select(*select_task_columns(fields))
+                .where(*TaskCRUD.build_task_filters(filters or {}))
+                .order_by(*TASK_SORT_ORDERS[sort])
+                .offset(skip)
+                .limit(limit)
+            ).all()
         except Exception as error:
             logger_instance.error(f"Ошибка получения списка задач: {error}")
             raise
 
+    @staticmethod
+    def get_tasks_after(
+            database_session: Session,
+            after_task_id: int,
+            limit: int = 100,
+            filters: Optional[dict] = None,
+            fields: Optional[Sequence[str]] = None
+    ) -> List[Row]:
+        try:
+            return database_session.execute(
+                select(*select_task_columns(fields))
+                .where(TaskModel.id > after_task_id, *TaskCRUD.build_task_filters(filters or {}))
+                .order_by(TaskModel.id)
+                .limit(limit)
+            ).all()
+        except Exception as error:
+            logger_instance.error(f"Ошибка получения страницы задач после {after_task_id}: {error}")
+            raise
+
+    @staticmethod
+    def search_tasks(database_session: Session, search_query: str, skip: int = 0, limit: int = 100) -> List[Row]:
+        try:
+            if database_session.get_bind().dialect.name != "sqlite":
+                pattern = f"%{search_query}%"
+                return database_session.execute(
+                    select(*TASK_ROW_COLUMNS)
+                    .where(TaskModel.title.ilike(pattern) | TaskModel.description.ilike(pattern))
+                    .order_by(TaskModel.id)
+                    .offset(skip)
+                    .limit(limit)
+                ).all()
+            selected_columns = ", ".join(f"kitty_tasks.{column.key}" for column in TASK_ROW_COLUMNS)
+            return database_session.execute(
+                text(
+                    f"SELECT {selected_columns} FROM {TASK_SEARCH_TABLE} "
+                    f"JOIN kitty_tasks ON kitty_tasks.id = {TASK_SEARCH_TABLE}.rowid "
+                    f"WHERE {TASK_SEARCH_TABLE} MATCH :search_expression "
+                    f"ORDER BY bm25({TASK_SEARCH_TABLE}, 10.0, 1.0), kitty_tasks.id "
+                    f"LIMIT :limit OFFSET :skip"
+                ).columns(*TASK_ROW_COLUMNS),
+                {"search_expression": build_search_expression(search_query), "limit": limit, "skip": skip}
+            ).all()
+        except Exception as error:
+            logger_instance.error(f"Ошибка поиска задач по '{search_query}': {error}")
+            raise
+
+    @staticmethod
+    def count_search_results(database_session: Session, search_query: str) -> int:
+        try:
+            if database_session.get_bind().dialect.name != "sqlite":
+                pattern = f"%{search_query}%"
+                return (
+                    database_session.query(TaskModel)
+                    .filter(TaskModel.title.ilike(pattern) | TaskModel.description.ilike(pattern))
+                    .count()
+                )
+            return database_session.execute(
+                text(f"SELECT count(*) FROM {TASK_SEARCH_TABLE} WHERE {TASK_SEARCH_TABLE} MATCH :search_expression"),
+                {"search_expression": build_search_expression(search_query)}
+            ).scalar()
+        except Exception as error:
+            logger_instance.error(f"Ошибка подсчета результатов поиска '{search_query}': {error}")
+            raise
+
+    @staticmethod
+    def iter_task_rows(database_session: Session, batch_size: int = 1000) -> Iterator[Sequence[Any]]:
+        result = database_session.execute(
+            select(*TASK_ROW_COLUMNS).order_by(TaskModel.id).execution_options(yield_per=batch_size)
+        )
+        for rows_batch in result.partitions():
+            yield rows_batch
+
     @staticmethod
     def update_task(
             database_session: Session,
@@ -85,6 +262,7 @@ class TaskCRUD:
                 return False
 
             database_session.delete(db_task_instance)
+            TaskCRUD.adjust_task_counter(database_session, -1)
             database_session.commit()
             logger_instance.info(f"Удалена задача с ID: {task_id}")
             return True
@@ -94,12 +272,282 @@ class TaskCRUD:
             raise
 
     @staticmethod
-    def count_tasks(database_session: Session) -> int:
+    def build_task_filters(filters: dict) -> list:
+        conditions = []
+        if filters.get("status") is not None:
+            conditions.append(TaskModel.status == TaskStatus(filters["status"]))
+        if filters.get("category") is not None:
+            conditions.append(TaskModel.category == KittyCategory(filters["category"]))
+        if filters.get("priority") is not None:
+            conditions.append(TaskModel.priority == filters["priority"])
+        if filters.get("priority_min") is not None:
+            conditions.append(TaskModel.priority >= filters["priority_min"])
+        if filters.get("priority_max") is not None:
+            conditions.append(TaskModel.priority <= filters["priority_max"])
+        if filters.get("created_from") is not None:
+            conditions.append(TaskModel.created_at >= to_naive_utc(filters["created_from"]))
+        if filters.get("created_to") is not None:
+            conditions.append(TaskModel.created_at <= to_naive_utc(filters["created_to"]))
+        if filters.get("task_ids") is not None:
+            conditions.append(TaskModel.id.in_(filters["task_ids"]))
+        return conditions
+
+    @staticmethod
+    def update_tasks_by_filter(database_session: Session, filters: dict, update_data: dict) -> int:
+        try:
+            values = {}
+            for field_name, field_value in update_data.items():
+                if field_value is None:
+                    continue
+                if field_name == "status":
+                    values[field_name] = TaskStatus(field_value)
+                elif field_name == "category":
+                    values[field_name] = KittyCategory(field_value)
+                else:
+                    values[field_name] = field_value
+            if not values:
+                return 0
+
+            result = database_session.execute(
+                update(TaskModel)
+                .where(*TaskCRUD.build_task_filters(filters))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            database_session.commit()
+            logger_instance.info(f"Обновлено задач по фильтру: {result.rowcount}")
+            return result.rowcount
+        except Exception as error:
+            database_session.rollback()
+            logger_instance.error(f"Ошибка пакетного обновления задач: {error}")
+            raise
+
+    @staticmethod
+    def delete_tasks_by_filter(database_session: Session, filters: dict) -> int:
+        try:
+            result = database_session.execute(
+                delete(TaskModel)
+                .where(*TaskCRUD.build_task_filters(filters))
+                .execution_options(synchronize_session=False)
+            )
+            TaskCRUD.adjust_task_counter(database_session, -result.rowcount)
+            database_session.commit()
+            logger_instance.info(f"Удалено задач по фильтру: {result.rowcount}")
+            return result.rowcount
+        except Exception as error:
+            database_session.rollback()
+            logger_instance.error(f"Ошибка пакетного удаления задач: {error}")
+            raise
+
+    @staticmethod
+    def adjust_task_counter(database_session: Session, delta: int) -> None:
+        database_session.execute(
+            update(TaskCounterModel)
+            .where(TaskCounterModel.name == TASKS_COUNTER_NAME)
+            .values(value=TaskCounterModel.value + delta)
+        )
+
+    @staticmethod
+    def reconcile_task_counter(database_session: Session) -> int:
+        try:
+            actual_count = database_session.query(TaskModel).count()
+            database_session.merge(TaskCounterModel(name=TASKS_COUNTER_NAME, value=actual_count))
+            database_session.commit()
+            logger_instance.info(f"Счетчик задач сверен: {actual_count}")
+            return actual_count
+        except Exception as error:
+            database_session.rollback()
+            logger_instance.error(f"Ошибка сверки счетчика задач: {error}")
+            raise
+
+    @staticmethod
+    def count_tasks(database_session: Session, filters: Optional[dict] = None) -> Optional[int]:
         try:
-            return database_session.query(TaskModel).count()
+            if filters:
+                return database_session.query(TaskModel).filter(*TaskCRUD.build_task_filters(filters)).count()
+            # None, если строки счетчика еще нет: сверка пишет в базу и делается не на чтении
+            return (
+                database_session.query(TaskCounterModel.value)
+                .filter(TaskCounterModel.name == TASKS_COUNTER_NAME)
+                .scalar()
+            )
         except Exception as error:
             logger_instance.error(f"Ошибка подсчета задач: {error}")
             raise
 
+    @staticmethod
+    def get_task_stats(database_session: Session) -> dict:
+        try:
+            grouped_rows = database_session.execute(
+                select(TaskModel.status, TaskModel.category, TaskModel.priority, func.count())
+                .group_by(TaskModel.status, TaskModel.category, TaskModel.priority)
+            ).all()
+
+            by_status = {task_status.value: 0 for task_status in TaskStatus}
+            by_category = {category.value: 0 for category in KittyCategory}
+            by_priority = {str(priority): 0 for priority in range(1, 6)}
+            for task_status, category, priority, tasks_count in grouped_rows:
+                by_status[task_status.value] += tasks_count
+                by_category[category.value] += tasks_count
+                by_priority[str(priority)] = by_priority.get(str(priority), 0) + tasks_count
+
+            return {
+                "total": sum(by_status.values()),
+                "by_status": by_status,
+                "by_category": by_category,
+                "by_priority": by_priority,
+            }
+        except Exception as error:
+            logger_instance.error(f"Ошибка подсчета статистики задач: {error}")
+            raise
+
+
+sqlite_write_lock = asyncio.Lock()
+
+
+def is_sqlite_busy_error(error: OperationalError) -> bool:
+    error_message = str(error.orig).lower()
+    return "database is locked" in error_message or "database is busy" in error_message
+
+
+async def run_crud_method(
+        database_session: Union[Session, AsyncSession],
+        crud_method: Callable[..., Any],
+        *args: Any
+) -> Any:
+    if isinstance(database_session, AsyncSession):
+        return await database_session.run_sync(crud_method, *args)
+    return await run_in_threadpool(crud_method, database_session, *args)
+
+
+async def run_crud_write_method(
+        database_session: Union[Session, AsyncSession],
+        crud_method: Callable[..., Any],
+        *args: Any
+) -> Any:
+    # SQLite допускает одного писателя: ждать очереди в event loop дешевле,
+    # чем держать блокировку файла, пока соседние соединения упираются в busy_timeout.
+    async with sqlite_write_lock:
+        # Блокировка выше работает только внутри процесса. Воркеры gunicorn пишут
+        # в тот же файл, и если чужая транзакция держит его дольше busy_timeout,
+        # повторяем запись с экспоненциальной паузой вместо ошибки 500.
+        for attempt_number in range(1, SQLITE_WRITE_RETRY_ATTEMPTS + 1):
+            try:
+                return await run_crud_method(database_session, crud_method, *args)
+            except OperationalError as error:
+                if attempt_number == SQLITE_WRITE_RETRY_ATTEMPTS or not is_sqlite_busy_error(error):
+                    raise
+                retry_delay = SQLITE_WRITE_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt_number - 1)
+                logger_instance.warning(f"База занята другим процессом, повтор записи через {retry_delay:.2f} с")
+                await asyncio.sleep(retry_delay * random.uniform(0.5, 1.5))
+
+
+class AsyncTaskCRUD:
+
+    @staticmethod
+    async def create_task(database_session: Union[Session, AsyncSession], task_data: dict) -> TaskModel:
+        return await run_crud_write_method(database_session, TaskCRUD.create_task, task_data)
+
+    @staticmethod
+    async def create_tasks_bulk(database_session: Union[Session, AsyncSession], tasks_data: List[dict]) -> List[int]:
+        return await run_crud_write_method(database_session, TaskCRUD.create_tasks_bulk, tasks_data)
+
+    @staticmethod
+    async def get_task_by_id(database_session: Union[Session, AsyncSession], task_id: int) -> Optional[TaskModel]:
+        return await run_crud_method(database_session, TaskCRUD.get_task_by_id, task_id)
+
+    @staticmethod
+    async def get_task_row(
+            database_session: Union[Session, AsyncSession],
+            task_id: int,
+            fields: Optional[Sequence[str]] = None
+    ) -> Optional[Row]:
+        return await run_crud_method(database_session, TaskCRUD.get_task_row, task_id, fields)
+
+    @staticmethod
+    async def get_all_tasks(
+            database_session: Union[Session, AsyncSession],
+            skip: int = 0,
+            limit: int = 100,
+            filters: Optional[dict] = None,
+            sort: str = "id",
+            fields: Optional[Sequence[str]] = None
+    ) -> List[Row]:
+        return await run_crud_method(database_session, TaskCRUD.get_all_tasks, skip, limit, filters, sort, fields)
+
+    @staticmethod
+    async def get_tasks_after(
+            database_session: Union[Session, AsyncSession],
+            after_task_id: int,
+            limit: int = 100,
+            filters: Optional[dict] = None,
+            fields: Optional[Sequence[str]] = None
+    ) -> List[Row]:
+        return await run_crud_method(
+            database_session, TaskCRUD.get_tasks_after, after_task_id, limit, filters, fields
+        )
+
+    @staticmethod
+    async def search_tasks(
+            database_session: Union[Session, AsyncSession],
+            search_query: str,
+            skip: int = 0,
+            limit: int = 100
+    ) -> List[Row]:
+        return await run_crud_method(database_session, TaskCRUD.search_tasks, search_query, skip, limit)
+
+    @staticmethod
+    async def count_search_results(database_session: Union[Session, AsyncSession], search_query: str) -> int:
+        return await run_crud_method(database_session, TaskCRUD.count_search_results, search_query)
+
+    @staticmethod
+    async def stream_task_rows(database_session: AsyncSession, batch_size: int = 1000) -> AsyncIterator[Sequence[Any]]:
+        result = await database_session.stream(
+            select(*TASK_ROW_COLUMNS).order_by(TaskModel.id).execution_options(yield_per=batch_size)
+        )
+        async for rows_batch in result.partitions():
+            yield rows_batch
+
+    @staticmethod
+    async def update_task(
+            database_session: Union[Session, AsyncSession],
+            db_task_instance: TaskModel,
+            update_data: dict
+    ) -> TaskModel:
+        return await run_crud_write_method(database_session, TaskCRUD.update_task, db_task_instance, update_data)
+
+    @staticmethod
+    async def delete_task(database_session: Union[Session, AsyncSession], task_id: int) -> bool:
+        return await run_crud_write_method(database_session, TaskCRUD.delete_task, task_id)
+
+    @staticmethod
+    async def update_tasks_by_filter(
+            database_session: Union[Session, AsyncSession],
+            filters: dict,
+            update_data: dict
+    ) -> int:
+        return await run_crud_write_method(database_session, TaskCRUD.update_tasks_by_filter, filters, update_data)
+
+    @staticmethod
+    async def delete_tasks_by_filter(database_session: Union[Session, AsyncSession], filters: dict) -> int:
+        return await run_crud_write_method(database_session, TaskCRUD.delete_tasks_by_filter, filters)
+
+    @staticmethod
+    async def reconcile_task_counter(database_session: Union[Session, AsyncSession]) -> int:
+        return await run_crud_write_method(database_session, TaskCRUD.reconcile_task_counter)
+
+    @staticmethod
+    async def count_tasks(database_session: Union[Session, AsyncSession], filters: Optional[dict] = None) -> int:
+        task_count = await run_crud_method(database_session, TaskCRUD.count_tasks, filters)
+        if task_count is None:
+            # Сверка создает строку счетчика, поэтому идет под блокировкой записи и с повторами
+            task_count = await AsyncTaskCRUD.reconcile_task_counter(database_session)
+        return task_count
+
+    @staticmethod
+    async def get_task_stats(database_session: Union[Session, AsyncSession]) -> dict:
+        return await run_crud_method(database_session, TaskCRUD.get_task_stats)
+
 
-task_crud_instance = TaskCRUD()
\ No newline at end of file
+task_crud_instance = TaskCRUD()
+async_task_crud_instance = AsyncTaskCRUD()
\ No newline at end of file
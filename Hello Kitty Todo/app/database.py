@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from app.config import app_settings
@@ -7,19 +8,85 @@ import logging
 
 logger_instance = logging.getLogger(__name__)
 
+SQLITE_PRAGMA_PROFILES = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+
+def apply_sqlite_pragmas(engine, profile_name: str) -> None:
+    if engine.dialect.name != "sqlite":
+        return
+    if profile_name not in SQLITE_PRAGMA_PROFILES:
+        raise ValueError(f"Неизвестный профиль SQLite: {profile_name}")
+    pragmas = SQLITE_PRAGMA_PROFILES[profile_name]
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma_name, pragma_value in pragmas.items():
+                cursor.execute(f"PRAGMA {pragma_name}={pragma_value}")
+        finally:
+            cursor.close()
+
+
 database_engine = create_engine(
     app_settings.database_url,
     connect_args={"check_same_thread": False} if "sqlite" in app_settings.database_url else {}
 )
+apply_sqlite_pragmas(database_engine, app_settings.sqlite_pragma_profile)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=database_engine)
 
 BaseModel = declarative_base()
 
+async_database_engine = None
+AsyncSessionLocal = None
+
+
+def build_async_database_url(database_url: str) -> str:
+    if database_url.startswith("sqlite://"):
+        return database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return database_url
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    global async_database_engine, AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        async_database_engine = create_async_engine(build_async_database_url(app_settings.database_url))
+        apply_sqlite_pragmas(async_database_engine.sync_engine, app_settings.sqlite_pragma_profile)
+        AsyncSessionLocal = async_sessionmaker(
+            bind=async_database_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return AsyncSessionLocal
+
+
+async def dispose_async_database_engine():
+    global async_database_engine, AsyncSessionLocal
+    if async_database_engine is not None:
+        await async_database_engine.dispose()
+    async_database_engine = None
+    AsyncSessionLocal = None
+
 
 def initialize_database():
     try:
         BaseModel.metadata.create_all(bind=database_engine)
+        for table in BaseModel.metadata.sorted_tables:
+            for table_index in table.indexes:
+                table_index.create(bind=database_engine, checkfirst=True)
         logger_instance.info("База данных успешно инициализирована")
     except Exception as error:
         logger_instance.error(f"Ошибка инициализации базы данных: {error}")
@@ -42,4 +109,18 @@ def get_database_session():
 
 def get_db_dependency():
     with get_database_session() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+async def get_async_db_dependency():
+    async with get_async_session_factory()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception as error:
+            await session.rollback()
+            logger_instance.error(f"Ошибка в асинхронной сессии БД: {error}")
+            raise
+
+
+get_task_db_dependency = get_async_db_dependency if app_settings.database_async_mode else get_db_dependency
@@ -0,0 +1,127 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Set
+import asyncio
+import logging
+import random
+
+import orjson
+import redis
+import redis.asyncio
+
+from app import warmup
+from app.cache import CACHE_KEY_PREFIX
+from app.serialization import task_to_dict
+
+logger_instance = logging.getLogger(__name__)
+
+TASK_EVENTS_CHANNEL = f"{CACHE_KEY_PREFIX}:task-events"
+EVENT_QUEUE_SIZE = 100
+EVENT_HEARTBEAT_SECONDS = 15.0
+EVENT_RETRY_MILLISECONDS = 5000
+
+RESYNC_PAYLOAD = orjson.dumps({"type": "resync"})
+
+
+class TaskEventBroadcaster:
+
+    def __init__(self):
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.redis_client: Optional[redis.asyncio.Redis] = None
+        self.listener_task: Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        subscriber_queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self.subscribers.add(subscriber_queue)
+        return subscriber_queue
+
+    def unsubscribe(self, subscriber_queue: asyncio.Queue) -> None:
+        self.subscribers.discard(subscriber_queue)
+
+    def deliver(self, payload: bytes) -> None:
+        for subscriber_queue in list(self.subscribers):
+            try:
+                subscriber_queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Клиент не успевает читать: вместо накопленных дельт
+                # он получит одно событие resync и перечитает список сам.
+                while not subscriber_queue.empty():
+                    subscriber_queue.get_nowait()
+                subscriber_queue.put_nowait(RESYNC_PAYLOAD)
+
+    async def publish(self, event: dict) -> None:
+        payload = orjson.dumps(event)
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.publish(TASK_EVENTS_CHANNEL, payload)
+                return
+            except redis.RedisError as error:
+                logger_instance.warning(f"Ошибка публикации события в Redis: {error}")
+        self.deliver(payload)
+
+    async def publish_task(self, event_type: str, task: Any) -> None:
+        await self.publish({"type": event_type, "task": task_to_dict(task)})
+
+    async def publish_deleted(self, task_id: int) -> None:
+        await self.publish({"type": "deleted", "task_id": task_id})
+
+    async def publish_resync(self) -> None:
+        await self.publish({"type": "resync"})
+
+    def attach(self, redis_client: Optional[redis.asyncio.Redis]) -> None:
+        self.redis_client = redis_client
+        if redis_client is not None:
+            self.listener_task = asyncio.create_task(self.listen_redis(redis_client))
+
+    async def detach(self) -> None:
+        self.redis_client = None
+        if self.listener_task is not None:
+            self.listener_task.cancel()
+            try:
+                await self.listener_task
+            except asyncio.CancelledError:
+                pass
+            self.listener_task = None
+
+    async def listen_redis(self, redis_client: redis.asyncio.Redis) -> None:
+        retry_delay = warmup.REDIS_RETRY_INITIAL_DELAY_SECONDS
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(TASK_EVENTS_CHANNEL)
+                if self.redis_client is None:
+                    # Redis вернулся: снова публикуем через канал, а пропущенное
+                    # за время разрыва клиенты перечитают по resync
+                    logger_instance.info("Подписка на события задач восстановлена")
+                    self.redis_client = redis_client
+                    self.deliver(RESYNC_PAYLOAD)
+                retry_delay = warmup.REDIS_RETRY_INITIAL_DELAY_SECONDS
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=EVENT_HEARTBEAT_SECONDS)
+                    if message is not None:
+                        self.deliver(message["data"])
+            except (redis.RedisError, OSError) as error:
+                if self.redis_client is not None:
+                    logger_instance.warning(f"Подписка на события задач потеряна, работаем локально и переподключаемся: {error}")
+                    self.redis_client = None
+                    self.deliver(RESYNC_PAYLOAD)
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(retry_delay * random.uniform(0.8, 1.2))
+            retry_delay = min(retry_delay * 2, warmup.REDIS_RETRY_MAX_DELAY_SECONDS)
+
+
+async def stream_task_events(is_disconnected: Callable[[], Awaitable[bool]]) -> AsyncIterator[bytes]:
+    subscriber_queue = task_event_broadcaster_instance.subscribe()
+    try:
+        yield f"retry: {EVENT_RETRY_MILLISECONDS}\n\n".encode()
+        while not await is_disconnected():
+            try:
+                payload = await asyncio.wait_for(subscriber_queue.get(), timeout=EVENT_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+            yield b"data: " + payload + b"\n\n"
+    finally:
+        task_event_broadcaster_instance.unsubscribe(subscriber_queue)
+
+
+task_event_broadcaster_instance = TaskEventBroadcaster()
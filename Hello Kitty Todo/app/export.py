@@ -0,0 +1,84 @@
+from typing import Any, AsyncIterator, Iterator, Sequence, Union
+import csv
+import io
+import logging
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud import task_crud_instance, async_task_crud_instance
+from app.serialization import TASK_FIELD_NAMES, task_row_to_dict
+
+logger_instance = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def export_field_value(value: Any) -> Any:
+    if hasattr(value, "value"):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def format_ndjson_batch(rows_batch: Sequence[Sequence[Any]]) -> bytes:
+    return b"".join(
+        orjson.dumps(task_row_to_dict(row)) + b"\n"
+        for row in rows_batch
+    )
+
+
+def format_csv_batch(rows_batch: Sequence[Sequence[Any]], include_header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if include_header:
+        writer.writerow(TASK_FIELD_NAMES)
+    for row in rows_batch:
+        writer.writerow(["" if value is None else export_field_value(value) for value in row])
+    return buffer.getvalue().encode("utf-8")
+
+
+def format_batches(rows_batches: Iterator[Sequence[Sequence[Any]]], export_format: str) -> Iterator[bytes]:
+    if export_format == "csv":
+        yield format_csv_batch([], include_header=True)
+        for rows_batch in rows_batches:
+            yield format_csv_batch(rows_batch)
+    else:
+        for rows_batch in rows_batches:
+            yield format_ndjson_batch(rows_batch)
+
+
+# Сессию закрывает зависимость FastAPI уже после отправки всего потока
+def iter_export_chunks(database_session: Session, export_format: str) -> Iterator[bytes]:
+    try:
+        yield from format_batches(task_crud_instance.iter_task_rows(database_session, EXPORT_BATCH_SIZE), export_format)
+    except Exception as error:
+        logger_instance.error(f"Ошибка экспорта задач: {error}")
+        raise
+
+
+async def stream_export_chunks(database_session: AsyncSession, export_format: str) -> AsyncIterator[bytes]:
+    try:
+        if export_format == "csv":
+            yield format_csv_batch([], include_header=True)
+        async for rows_batch in async_task_crud_instance.stream_task_rows(database_session, EXPORT_BATCH_SIZE):
+            if export_format == "csv":
+                yield format_csv_batch(rows_batch)
+            else:
+                yield format_ndjson_batch(rows_batch)
+    except Exception as error:
+        logger_instance.error(f"Ошибка экспорта задач: {error}")
+        raise
+
+
+def build_export_stream(database_session: Union[Session, AsyncSession], export_format: str):
+    if isinstance(database_session, AsyncSession):
+        return stream_export_chunks(database_session, export_format)
+    return iter_export_chunks(database_session, export_format)
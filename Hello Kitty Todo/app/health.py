@@ -0,0 +1,165 @@
+from datetime import datetime
+from typing import Optional
+import asyncio
+import logging
+import os
+import time
+
+import orjson
+import redis.asyncio
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import text
+
+from app.config import app_settings
+from app.database import database_engine
+
+logger_instance = logging.getLogger(__name__)
+
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+HEALTH_CHECK_DURATION = Histogram(
+    'kitty_health_check_duration_seconds',
+    'Duration of background dependency health checks',
+    ['dependency'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0)
+)
+HEALTH_CHECK_UP = Gauge(
+    'kitty_health_check_up',
+    'Last health check result per dependency',
+    ['dependency'],
+    multiprocess_mode='min'
+)
+
+
+def check_database() -> dict:
+    db_path = app_settings.database_url.replace("sqlite:///", "")
+    if "sqlite" in app_settings.database_url and not os.path.exists(db_path):
+        return {
+            "status": "file_not_found",
+            "emoji": "📁",
+            "message": f"Файл базы данных не найден: {db_path}",
+            "action": "Будет создан при первой записи"
+        }
+    # Соединение берется из пула движка, а не открывается заново на каждую проверку
+    with database_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return {
+        "status": "connected",
+        "emoji": "💾",
+        "message": "База данных работает",
+        "details": f"SQLite: {db_path}"
+    }
+
+
+class HealthProber:
+
+    def __init__(self):
+        self.redis_client: Optional[redis.asyncio.Redis] = None
+        self.prober_task: Optional[asyncio.Task] = None
+        self.health_status: Optional[dict] = None
+        self.health_payload: Optional[bytes] = None
+
+    async def timed_check(self, dependency: str, check) -> Optional[Exception]:
+        start_time = time.perf_counter()
+        try:
+            await asyncio.wait_for(check(), timeout=HEALTH_CHECK_TIMEOUT_SECONDS)
+            return None
+        except Exception as error:
+            return error
+        finally:
+            HEALTH_CHECK_DURATION.labels(dependency=dependency).observe(time.perf_counter() - start_time)
+
+    async def probe_redis(self, health_status: dict) -> None:
+        if self.redis_client is None:
+            return
+        error = await self.timed_check("redis", self.redis_client.ping)
+        HEALTH_CHECK_UP.labels(dependency="redis").set(error is None)
+        if error is None:
+            health_status["services"]["redis"] = {
+                "status": "connected",
+                "emoji": "🎀",
+                "message": "Redis готов к работе!",
+                "details": f"{app_settings.redis_host}:{app_settings.redis_port}"
+            }
+            return
+        health_status["services"]["redis"] = {
+            "status": "error",
+            "emoji": "💔",
+            "message": str(error) or type(error).__name__
+        }
+        health_status["status"] = "degraded ⚠️"
+
+    async def probe_database(self, health_status: dict) -> None:
+        database_result = {}
+
+        async def run_database_check():
+            database_result.update(await asyncio.to_thread(check_database))
+
+        error = await self.timed_check("database", run_database_check)
+        HEALTH_CHECK_UP.labels(dependency="database").set(error is None and database_result["status"] == "connected")
+        if error is not None:
+            health_status["services"]["database"] = {
+                "status": "error",
+                "emoji": "💾💔",
+                "message": str(error) or type(error).__name__
+            }
+            health_status["status"] = "unhealthy 💔"
+            return
+        health_status["services"]["database"] = database_result
+        if database_result["status"] != "connected" and health_status["status"] == "healthy ❤️":
+            health_status["status"] = "degraded ⚠️"
+
+    async def probe(self) -> dict:
+        health_status = {
+            "status": "healthy ❤️",
+            "emoji": "🐱🎀🌸",
+            "services": {},
+            "kitty_message": "Всё работает отлично! 🎀",
+            "timestamp": datetime.now().isoformat(),
+            "version": app_settings.api_version
+        }
+        await self.probe_redis(health_status)
+        await self.probe_database(health_status)
+
+        self.health_status = health_status
+        self.health_payload = orjson.dumps(health_status)
+        return health_status
+
+    async def get_health_status(self) -> dict:
+        # До первого прохода фонового пробника (например, без lifespan) проверяем один раз сами
+        if self.health_status is None:
+            await self.probe()
+        return self.health_status
+
+    async def get_health_payload(self) -> bytes:
+        if self.health_payload is None:
+            await self.probe()
+        return self.health_payload
+
+    async def run_prober(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await self.probe()
+            except Exception as error:
+                logger_instance.error(f"Ошибка фоновой проверки здоровья: {error}")
+            await asyncio.sleep(interval_seconds)
+
+    def attach(self, redis_client: Optional[redis.asyncio.Redis]) -> None:
+        self.redis_client = redis_client
+
+    def start(self, redis_client: Optional[redis.asyncio.Redis]) -> None:
+        self.redis_client = redis_client
+        self.prober_task = asyncio.create_task(self.run_prober(app_settings.health_probe_interval_seconds))
+
+    async def stop(self) -> None:
+        if self.prober_task is not None:
+            self.prober_task.cancel()
+            try:
+                await self.prober_task
+            except asyncio.CancelledError:
+                pass
+            self.prober_task = None
+        self.redis_client = None
+
+
+health_prober_instance = HealthProber()
@@ -1,76 +1,98 @@
-from fastapi import FastAPI, Depends, HTTPException, status, Request
+from fastapi import FastAPI, Depends, HTTPException, status, Request, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 from loguru import logger
 import redis
-from prometheus_client import make_asgi_app, Counter, Histogram
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+import redis.asyncio
+from prometheus_client import make_asgi_app, CollectorRegistry, multiprocess
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+import asyncio
 import os
 from datetime import datetime
-import sqlite3
 
 from app.config import app_settings
-from app.database import initialize_database, get_db_dependency
+from app.database import (
+    initialize_database,
+    get_task_db_dependency,
+    get_database_session,
+    dispose_async_database_engine,
+    database_engine,
+)
+from app.models import create_task_search_index
 from app import crud, schemas, dependencies
+from app.cache import response_cache_instance, build_etag, etag_matches
+from app.export import build_export_stream, EXPORT_MEDIA_TYPES
+from app.task_import import import_tasks
+from app.serialization import build_task_response, dumps_tasks_list, parse_task_fields
+from app.events import task_event_broadcaster_instance, stream_task_events
+from app.assets import PrecompressedStaticFiles, STATIC_DIRECTORY, static_url
+from app.compression import CompressionMiddleware
+from app.metrics import MetricsMiddleware, measure_stage
+from app.health import health_prober_instance
+from app.pages import RenderedPageCache, build_page_response
+from app.warmup import build_redis_client, connect_redis_with_backoff, reconcile_task_counter_in_background
+from app.pagination import encode_task_cursor, decode_task_cursor
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from typing import Optional, Union
 
 logger_instance = logging.getLogger(__name__)
 
-REQUEST_COUNTER = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
-REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration', ['method', 'endpoint'])
-
 redis_client_instance = None
+# Выставляется в мастере gunicorn (run_kitty.py); воркеры наследуют его через preload_app
+database_prepared = False
+
+
+def prepare_database_schema():
+    initialize_database()
+    with database_engine.begin() as connection:
+        create_task_search_index(None, connection)
+
+
+def prepare_database():
+    global database_prepared
+    prepare_database_schema()
+    with get_database_session() as database_session:
+        crud.task_crud_instance.reconcile_task_counter(database_session)
+    database_prepared = True
+
+
+def attach_redis(redis_client: redis.asyncio.Redis) -> None:
+    response_cache_instance.attach(redis_client)
+    task_event_broadcaster_instance.attach(redis_client)
+    health_prober_instance.attach(redis_client)
 
 
 @asynccontextmanager
 async def app_lifespan(app_instance: FastAPI):
+    global redis_client_instance
     try:
-        initialize_database()
+        if not database_prepared:
+            prepare_database_schema()
+        redis_client_instance = build_redis_client()
+        # Ни Redis, ни сверка счетчика не задерживают старт: приложение сразу
+        # принимает запросы, а кэш и события подключаются, как только Redis ответит
+        warmup_tasks = [asyncio.create_task(connect_redis_with_backoff(redis_client_instance, attach_redis))]
+        if not database_prepared:
+            warmup_tasks.append(asyncio.create_task(reconcile_task_counter_in_background()))
+        health_prober_instance.start(None)
         logger.info("Приложение запущено")
-
-        try:
-            if "sqlite" in app_settings.database_url:
-                db_path = app_settings.database_url.replace("sqlite:///", "")
-                if not os.path.exists(db_path):
-                    with open(db_path, 'w') as f:
-                        pass
-                    logger.info(f"Создан файл базы данных: {db_path}")
-
-                conn = sqlite3.connect(db_path)
-                conn.execute("SELECT 1")
-                conn.close()
-                logger.info("SQLite база данных подключена успешно")
-        except Exception as db_error:
-            logger.error(f"Ошибка подключения к базе данных: {db_error}")
-
-        global redis_client_instance
-        redis_client_instance = redis.Redis(
-            host=app_settings.redis_host,
-            port=app_settings.redis_port,
-            db=app_settings.redis_db,
-            decode_responses=True,
-            socket_connect_timeout=3,
-            socket_timeout=3
-        )
-
-        try:
-            redis_client_instance.ping()
-            logger.info("Redis подключен успешно")
-        except redis.ConnectionError:
-            logger.warning("Redis не доступен, работаем без кэша")
-            redis_client_instance = None
-            app_instance.dependency_overrides[get_db_dependency] = get_db_dependency
     except Exception as error:
         logger.error(f"Ошибка запуска: {error}")
         raise
 
     yield
 
-    if redis_client_instance:
-        redis_client_instance.close()
+    for warmup_task in warmup_tasks:
+        warmup_task.cancel()
+    await asyncio.gather(*warmup_tasks, return_exceptions=True)
+    await health_prober_instance.stop()
+    response_cache_instance.detach()
+    await task_event_broadcaster_instance.detach()
+    await redis_client_instance.aclose()
+    await redis_client_instance.connection_pool.disconnect()
+    await dispose_async_database_engine()
     logger.info("Приложение остановлено")
 
 
@@ -90,16 +112,21 @@ app_instance = FastAPI(
     }
 )
 
-os.makedirs("static", exist_ok=True)
-os.makedirs("static/css", exist_ok=True)
-
-app_instance.mount("/static", StaticFiles(directory="static"), name="static")
+app_instance.mount("/static", PrecompressedStaticFiles(directory=STATIC_DIRECTORY), name="static")
 
-templates = Jinja2Templates(directory="app/templates")
+rendered_page_cache_instance = RenderedPageCache("app/templates", {"static_url": static_url})
 
-metrics_app = make_asgi_app()
+if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+    # Несколько воркеров: каждый пишет метрики в свои файлы, /metrics складывает их
+    metrics_registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(metrics_registry)
+    metrics_app = make_asgi_app(registry=metrics_registry)
+else:
+    metrics_app = make_asgi_app()
 app_instance.mount("/metrics", metrics_app)
 
+app_instance.add_middleware(CompressionMiddleware)
+
 app_instance.add_middleware(
     CORSMiddleware,
     allow_origins=app_settings.cors_origins,
@@ -108,36 +135,18 @@ app_instance.add_middleware(
     allow_headers=["*"],
 )
 
+app_instance.add_middleware(MetricsMiddleware)
 
-@app_instance.middleware("http")
-async def collect_metrics_middleware(request, call_next):
-    import time
-    start_time = time.time()
-    response = await call_next(request)
-    duration = time.time() - start_time
-
-    REQUEST_COUNTER.labels(
-        method=request.method,
-        endpoint=request.url.path,
-        status=response.status_code
-    ).inc()
-
-    REQUEST_DURATION.labels(
-        method=request.method,
-        endpoint=request.url.path
-    ).observe(duration)
-
-    return response
 
 @app_instance.get("/")
 async def read_root(request: Request):
     accept = request.headers.get("accept", "")
 
     if "text/html" in accept:
-        return templates.TemplateResponse("index.html", {
-            "request": request,
-            "app_settings": app_settings
-        })
+        rendered_page = rendered_page_cache_instance.get_page(
+            "index.html", {"app_settings": app_settings}, app_settings
+        )
+        return build_page_response(request, rendered_page, vary="Accept, Accept-Encoding")
 
     return {
         "message": "🐱 Добро пожаловать в Hello Kitty Todo API! 🎀",
@@ -151,74 +160,19 @@ async def read_root(request: Request):
 
 @app_instance.get("/health")
 async def health_check(request: Request):
-    health_status = {
-        "status": "healthy ❤️",
-        "emoji": "🐱🎀🌸",
-        "services": {},
-        "kitty_message": "Всё работает отлично! 🎀",
-        "timestamp": datetime.now().isoformat(),
-        "version": app_settings.api_version
-    }
-
-    try:
-        if redis_client_instance:
-            redis_client_instance.ping()
-            health_status["services"]["redis"] = {
-                "status": "connected",
-                "emoji": "🎀",
-                "message": "Redis готов к работе!",
-                "details": f"{app_settings.redis_host}:{app_settings.redis_port}"
-            }
-    except Exception as e:
-        health_status["services"]["redis"] = {
-            "status": "error",
-            "emoji": "💔",
-            "message": str(e)
-        }
-        health_status["status"] = "degraded ⚠️"
-
-    try:
-        if "sqlite" in app_settings.database_url:
-            db_path = app_settings.database_url.replace("sqlite:///", "")
-
-            if os.path.exists(db_path):
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                conn.close()
-
-                health_status["services"]["database"] = {
-                    "status": "connected",
-                    "emoji": "💾",
-                    "message": "База данных работает",
-                    "details": f"SQLite: {db_path}"
-                }
-            else:
-                health_status["services"]["database"] = {
-                    "status": "file_not_found",
-                    "emoji": "📁",
-                    "message": f"Файл базы данных не найден: {db_path}",
-                    "action": "Будет создан при первой записи"
-                }
-                health_status["status"] = "degraded ⚠️"
-    except Exception as e:
-        health_status["services"]["database"] = {
-            "status": "error",
-            "emoji": "💾💔",
-            "message": str(e)
-        }
-        health_status["status"] = "unhealthy 💔"
-
     accept = request.headers.get("accept", "")
     if "text/html" in accept:
-        return templates.TemplateResponse("health.html", {
-            "request": request,
-            "health_status": health_status,
-            "app_settings": app_settings,
-            "datetime": datetime
-        })
+        health_status = await health_prober_instance.get_health_status()
+        # Страница перерисовывается только когда фоновая проверка обновила снимок
+        rendered_page = rendered_page_cache_instance.get_page(
+            "health.html",
+            {"health_status": health_status, "app_settings": app_settings, "datetime": datetime},
+            app_settings,
+            context_key=health_status["timestamp"]
+        )
+        return build_page_response(request, rendered_page, vary="Accept, Accept-Encoding")
 
-    return JSONResponse(content=health_status)
+    return Response(content=await health_prober_instance.get_health_payload(), media_type="application/json")
 
 
 @app_instance.get("/kitty")
@@ -228,47 +182,109 @@ async def hello_kitty_page():
 
 @app_instance.get("/kitty/tasks-ui")
 async def kitty_tasks_ui(request: Request):
-    return templates.TemplateResponse("tasks-ui.html", {"request": request})
+    return build_page_response(request, rendered_page_cache_instance.get_page("tasks-ui.html", {}, app_settings))
+
+def parse_task_fields_or_400(fields_param: Optional[str]):
+    try:
+        return parse_task_fields(fields_param)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        )
+
+
+def build_etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def build_not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=build_etag_headers(etag))
+
 
 @app_instance.get("/tasks", response_model=schemas.TasksListResponseSchema)
-def read_tasks_list(
+async def read_tasks_list(
         skip_param: int = 0,
         limit_param: int = 100,
-        database_session: Session = Depends(get_db_dependency)
+        cursor_param: Optional[str] = None,
+        include_total: bool = True,
+        status_param: Optional[schemas.TaskStatusEnum] = None,
+        category_param: Optional[schemas.KittyCategory] = None,
+        priority_min_param: Optional[int] = Query(None, ge=1, le=5),
+        priority_max_param: Optional[int] = Query(None, ge=1, le=5),
+        created_from_param: Optional[datetime] = None,
+        created_to_param: Optional[datetime] = None,
+        sort_param: schemas.TaskSortEnum = schemas.TaskSortEnum.ID,
+        fields_param: Optional[str] = Query(None, alias="fields"),
+        if_none_match: Optional[str] = Header(None),
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
 ):
+    task_fields = parse_task_fields_or_400(fields_param)
+
+    after_task_id = None
+    if cursor_param is not None:
+        if sort_param != schemas.TaskSortEnum.ID:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Курсорная пагинация доступна только при сортировке по id"
+            )
+        after_task_id = decode_task_cursor(cursor_param)
+        if after_task_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Некорректный курсор пагинации"
+            )
+
+    tasks_filters = {
+        "status": status_param.value if status_param else None,
+        "category": category_param.value if category_param else None,
+        "priority_min": priority_min_param,
+        "priority_max": priority_max_param,
+        "created_from": created_from_param,
+        "created_to": created_to_param,
+    }
+    tasks_filters = {name: value for name, value in tasks_filters.items() if value is not None}
+
     try:
-        cache_key = f"tasks:{skip_param}:{limit_param}"
-        if redis_client_instance:
-            try:
-                cached_data = redis_client_instance.get(cache_key)
-                if cached_data:
-                    logger.info("Данные получены из кэша")
-                    return eval(cached_data)
-            except:
-                pass
-
-        tasks_list = crud.task_crud_instance.get_all_tasks(database_session, skip_param, limit_param)
-        total_count = crud.task_crud_instance.count_tasks(database_session)
-
-        converted_tasks = []
-        for task in tasks_list:
-            converted_tasks.append(schemas.TaskResponseSchema.from_orm(task))
-
-        response_data = {
-            "tasks": converted_tasks,
-            "total": total_count,
-            "emoji": "🐱🎀🌸",
-            "theme": app_settings.theme.value if hasattr(app_settings.theme, 'value') else app_settings.theme,
-            "message": "Вот твои кавайные задачи!"
-        }
-
-        if redis_client_instance:
-            try:
-                redis_client_instance.setex(cache_key, 300, str(response_data))
-            except:
-                pass
-
-        return response_data
+        with measure_stage("/tasks", "cache_generation"):
+            cache_key = await response_cache_instance.current_list_key(
+                skip_param, limit_param, cursor_param or "", int(include_total), sort_param.value,
+                ",".join(f"{name}={value}" for name, value in sorted(tasks_filters.items())),
+                ",".join(task_fields)
+            )
+        etag = build_etag(cache_key)
+        if etag_matches(if_none_match, etag):
+            return build_not_modified_response(etag)
+
+        with measure_stage("/tasks", "cache_lookup"):
+            cached_payload = await response_cache_instance.get_bytes(cache_key)
+        if cached_payload is not None:
+            logger.info("Данные получены из кэша")
+            return Response(content=cached_payload, media_type="application/json", headers=build_etag_headers(etag))
+
+        with measure_stage("/tasks", "db_query"):
+            if after_task_id is not None:
+                tasks_list = await crud.async_task_crud_instance.get_tasks_after(
+                    database_session, after_task_id, limit_param, tasks_filters, task_fields
+                )
+            else:
+                tasks_list = await crud.async_task_crud_instance.get_all_tasks(
+                    database_session, skip_param, limit_param, tasks_filters, sort_param.value, task_fields
+                )
+            total_count = None
+            if include_total:
+                total_count = await crud.async_task_crud_instance.count_tasks(database_session, tasks_filters)
+
+        next_cursor = None
+        if sort_param == schemas.TaskSortEnum.ID and tasks_list and len(tasks_list) == limit_param:
+            next_cursor = encode_task_cursor(tasks_list[-1].id)
+
+        with measure_stage("/tasks", "serialization"):
+            response_payload = dumps_tasks_list(tasks_list, total_count, next_cursor, field_names=task_fields)
+        with measure_stage("/tasks", "cache_store"):
+            await response_cache_instance.set_bytes(cache_key, response_payload)
+
+        return Response(content=response_payload, media_type="application/json", headers=build_etag_headers(etag))
     except Exception as error:
         logger.error(f"Ошибка получения списка задач: {error}")
         raise HTTPException(
@@ -277,11 +293,126 @@ def read_tasks_list(
         )
 
 
+@app_instance.get("/tasks/export")
+async def export_tasks(
+        export_format: schemas.ExportFormatEnum = Query(schemas.ExportFormatEnum.NDJSON, alias="format"),
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
+):
+    return StreamingResponse(
+        build_export_stream(database_session, export_format.value),
+        media_type=EXPORT_MEDIA_TYPES[export_format.value],
+        headers={"Content-Disposition": f'attachment; filename="kitty_tasks.{export_format.value}"'}
+    )
+
+
+@app_instance.get("/tasks/search", response_model=schemas.TasksListResponseSchema)
+async def search_tasks_list(
+        q: str = Query(..., min_length=1, max_length=200),
+        skip_param: int = 0,
+        limit_param: int = Query(20, ge=1, le=100),
+        include_total: bool = True,
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
+):
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Пустой поисковый запрос"
+        )
+
+    try:
+        with measure_stage("/tasks/search", "db_query"):
+            found_tasks = await crud.async_task_crud_instance.search_tasks(database_session, q, skip_param, limit_param)
+            total_count = None
+            if include_total:
+                total_count = await crud.async_task_crud_instance.count_search_results(database_session, q)
+
+        with measure_stage("/tasks/search", "serialization"):
+            response_payload = dumps_tasks_list(found_tasks, total_count, message=f"Нашлось по запросу «{q}»!")
+        return Response(content=response_payload, media_type="application/json")
+    except Exception as error:
+        logger.error(f"Ошибка поиска задач: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Не удалось выполнить поиск"
+        )
+
+
+@app_instance.get("/tasks/events")
+async def stream_task_updates(request: Request):
+    return StreamingResponse(
+        stream_task_events(request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app_instance.get("/tasks/stats", response_model=schemas.TasksStatsSchema)
+async def read_tasks_stats(
+        if_none_match: Optional[str] = Header(None),
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
+):
+    try:
+        with measure_stage("/tasks/stats", "cache_generation"):
+            cache_key = await response_cache_instance.current_list_key("stats")
+        etag = build_etag(cache_key)
+        if etag_matches(if_none_match, etag):
+            return build_not_modified_response(etag)
+
+        with measure_stage("/tasks/stats", "cache_lookup"):
+            cached_payload = await response_cache_instance.get_bytes(cache_key)
+        if cached_payload is not None:
+            return Response(content=cached_payload, media_type="application/json", headers=build_etag_headers(etag))
+
+        with measure_stage("/tasks/stats", "db_query"):
+            task_stats = await crud.async_task_crud_instance.get_task_stats(database_session)
+        with measure_stage("/tasks/stats", "serialization"):
+            completed_count = task_stats["by_status"][schemas.TaskStatusEnum.DONE.value]
+            response_data = schemas.TasksStatsSchema(
+                **task_stats,
+                completed=completed_count,
+                pending=task_stats["total"] - completed_count,
+                completion_rate=round(completed_count / task_stats["total"], 4) if task_stats["total"] else 0.0
+            )
+            response_payload = response_data.model_dump_json().encode("utf-8")
+        with measure_stage("/tasks/stats", "cache_store"):
+            await response_cache_instance.set_bytes(cache_key, response_payload)
+
+        return Response(content=response_payload, media_type="application/json", headers=build_etag_headers(etag))
+    except Exception as error:
+        logger.error(f"Ошибка получения статистики задач: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Не удалось посчитать статистику"
+        )
+
+
 @app_instance.get("/tasks/{task_id}", response_model=schemas.TaskResponseSchema)
-def read_single_task(
-        task_instance: schemas.TaskResponseSchema = Depends(dependencies.get_task_by_id_dependency)
+async def read_single_task(
+        task_id: int,
+        fields_param: Optional[str] = Query(None, alias="fields"),
+        if_none_match: Optional[str] = Header(None),
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
 ):
-    return schemas.TaskResponseSchema.from_orm(task_instance)
+    task_fields = parse_task_fields_or_400(fields_param)
+    with measure_stage("/tasks/{task_id}", "cache_generation"):
+        cache_key = await response_cache_instance.current_list_key("task", task_id, ",".join(task_fields))
+    etag = build_etag(cache_key)
+    # "*" совпадает только с существующей задачей (RFC 7232), поэтому проверяется после поиска
+    wildcard_match = if_none_match is not None and if_none_match.strip() == "*"
+    if not wildcard_match and etag_matches(if_none_match, etag):
+        return build_not_modified_response(etag)
+
+    with measure_stage("/tasks/{task_id}", "db_query"):
+        task_row = await crud.async_task_crud_instance.get_task_row(database_session, task_id, task_fields)
+    if task_row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Задача с ID {task_id} не найдена"
+        )
+    if wildcard_match:
+        return build_not_modified_response(etag)
+    with measure_stage("/tasks/{task_id}", "serialization"):
+        return build_task_response(task_row, field_names=task_fields, headers=build_etag_headers(etag))
 
 
 @app_instance.post(
@@ -289,21 +420,18 @@ def read_single_task(
     response_model=schemas.TaskResponseSchema,
     status_code=status.HTTP_201_CREATED
 )
-def create_new_task(
+async def create_new_task(
         task_data: schemas.TaskCreateSchema,
-        database_session: Session = Depends(get_db_dependency)
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
 ):
     try:
         task_dict = task_data.model_dump()
-        created_task = crud.task_crud_instance.create_task(database_session, task_dict)
+        created_task = await crud.async_task_crud_instance.create_task(database_session, task_dict)
 
-        if redis_client_instance:
-            try:
-                redis_client_instance.delete("tasks:*")
-            except:
-                pass
+        await response_cache_instance.invalidate_task_lists()
+        await task_event_broadcaster_instance.publish_task("created", created_task)
 
-        return schemas.TaskResponseSchema.from_orm(created_task)
+        return build_task_response(created_task, status.HTTP_201_CREATED)
     except Exception as error:
         logger.error(f"Ошибка создания задачи: {error}")
         raise HTTPException(
@@ -312,25 +440,117 @@ def create_new_task(
         )
 
 
+@app_instance.post(
+    "/tasks/bulk",
+    response_model=schemas.TasksBulkResponseSchema,
+    status_code=status.HTTP_201_CREATED
+)
+async def create_tasks_in_bulk(
+        bulk_data: schemas.TasksBulkCreateSchema,
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
+):
+    try:
+        tasks_data = [task_data.model_dump() for task_data in bulk_data.tasks]
+        created_ids = await crud.async_task_crud_instance.create_tasks_bulk(database_session, tasks_data)
+
+        await response_cache_instance.invalidate_task_lists()
+        await task_event_broadcaster_instance.publish_resync()
+
+        return schemas.TasksBulkResponseSchema(created=len(created_ids), task_ids=created_ids)
+    except Exception as error:
+        logger.error(f"Ошибка пакетного создания задач: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Не удалось создать задачи"
+        )
+
+
+@app_instance.post("/tasks/import", response_model=schemas.TasksImportReportSchema)
+async def import_tasks_from_upload(
+        request: Request,
+        import_format: schemas.ExportFormatEnum = Query(schemas.ExportFormatEnum.NDJSON, alias="format"),
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
+):
+    try:
+        import_report = await import_tasks(database_session, request.stream(), import_format.value)
+
+        if import_report.imported:
+            await response_cache_instance.invalidate_task_lists()
+            await task_event_broadcaster_instance.publish_resync()
+
+        return import_report
+    except Exception as error:
+        logger.error(f"Ошибка импорта задач: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Не удалось импортировать задачи"
+        )
+
+
+@app_instance.patch("/tasks/bulk", response_model=schemas.TasksBulkResultSchema)
+async def update_tasks_in_bulk(
+        bulk_data: schemas.TasksBulkUpdateSchema,
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
+):
+    try:
+        affected_count = await crud.async_task_crud_instance.update_tasks_by_filter(
+            database_session,
+            bulk_data.filter.model_dump(exclude_none=True),
+            bulk_data.changes.model_dump(exclude_unset=True)
+        )
+
+        if affected_count:
+            await response_cache_instance.invalidate_task_lists()
+            await task_event_broadcaster_instance.publish_resync()
+
+        return schemas.TasksBulkResultSchema(affected=affected_count, message="Задачи обновлены!")
+    except Exception as error:
+        logger.error(f"Ошибка пакетного обновления задач: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Не удалось обновить задачи"
+        )
+
+
+@app_instance.delete("/tasks/bulk", response_model=schemas.TasksBulkResultSchema)
+async def delete_tasks_in_bulk(
+        tasks_filter: schemas.TasksFilterSchema,
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
+):
+    try:
+        affected_count = await crud.async_task_crud_instance.delete_tasks_by_filter(
+            database_session,
+            tasks_filter.model_dump(exclude_none=True)
+        )
+
+        if affected_count:
+            await response_cache_instance.invalidate_task_lists()
+            await task_event_broadcaster_instance.publish_resync()
+
+        return schemas.TasksBulkResultSchema(affected=affected_count, message="Задачи удалены!")
+    except Exception as error:
+        logger.error(f"Ошибка пакетного удаления задач: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Не удалось удалить задачи"
+        )
+
+
 @app_instance.put("/tasks/{task_id}", response_model=schemas.TaskResponseSchema)
-def update_task_completely(
+async def update_task_completely(
         task_id: int,
         task_data: schemas.TaskUpdateSchema,
-        database_session: Session = Depends(get_db_dependency),
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency),
         existing_task: schemas.TaskResponseSchema = Depends(dependencies.get_task_by_id_dependency)
 ):
     try:
         update_dict = task_data.model_dump(exclude_unset=True)
-        updated_task = crud.task_crud_instance.update_task(database_session, existing_task, update_dict)
+        updated_task = await crud.async_task_crud_instance.update_task(database_session, existing_task, update_dict)
 
-        if redis_client_instance:
-            try:
-                redis_client_instance.delete(f"task:{task_id}")
-                redis_client_instance.delete("tasks:*")
-            except:
-                pass
+        await response_cache_instance.invalidate_task_lists()
+        await task_event_broadcaster_instance.publish_task("updated", updated_task)
 
-        return schemas.TaskResponseSchema.from_orm(updated_task)
+        return build_task_response(updated_task)
     except Exception as error:
         logger.error(f"Ошибка обновления задачи: {error}")
         raise HTTPException(
@@ -340,24 +560,20 @@ def update_task_completely(
 
 
 @app_instance.patch("/tasks/{task_id}", response_model=schemas.TaskResponseSchema)
-def partially_update_task(
+async def partially_update_task(
         task_id: int,
         task_data: schemas.TaskUpdateSchema,
-        database_session: Session = Depends(get_db_dependency),
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency),
         existing_task: schemas.TaskResponseSchema = Depends(dependencies.get_task_by_id_dependency)
 ):
     try:
         update_dict = task_data.model_dump(exclude_unset=True)
-        updated_task = crud.task_crud_instance.update_task(database_session, existing_task, update_dict)
+        updated_task = await crud.async_task_crud_instance.update_task(database_session, existing_task, update_dict)
 
-        if redis_client_instance:
-            try:
-                redis_client_instance.delete(f"task:{task_id}")
-                redis_client_instance.delete("tasks:*")
-            except:
-                pass
+        await response_cache_instance.invalidate_task_lists()
+        await task_event_broadcaster_instance.publish_task("updated", updated_task)
 
-        return schemas.TaskResponseSchema.from_orm(updated_task)
+        return build_task_response(updated_task)
     except Exception as error:
         logger.error(f"Ошибка частичного обновления задачи: {error}")
         raise HTTPException(
@@ -367,24 +583,20 @@ def partially_update_task(
 
 
 @app_instance.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_existing_task(
+async def delete_existing_task(
         task_id: int,
-        database_session: Session = Depends(get_db_dependency)
+        database_session: Union[Session, AsyncSession] = Depends(get_task_db_dependency)
 ):
     try:
-        delete_successful = crud.task_crud_instance.delete_task(database_session, task_id)
+        delete_successful = await crud.async_task_crud_instance.delete_task(database_session, task_id)
         if not delete_successful:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Задача с ID {task_id} не найдена"
             )
 
-        if redis_client_instance:
-            try:
-                redis_client_instance.delete(f"task:{task_id}")
-                redis_client_instance.delete("tasks:*")
-            except:
-                pass
+        await response_cache_instance.invalidate_task_lists()
+        await task_event_broadcaster_instance.publish_deleted(task_id)
 
         return None
     except HTTPException:
@@ -0,0 +1,74 @@
+from typing import Optional
+import time
+
+from prometheus_client import Counter, Histogram
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ENDPOINT = "unmatched"
+STAGE_DURATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+REQUEST_COUNTER = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
+REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration', ['method', 'endpoint'])
+REQUEST_STAGE_DURATION = Histogram(
+    'kitty_request_stage_duration_seconds',
+    'Time spent in one stage of a request',
+    ['endpoint', 'stage'],
+    buckets=STAGE_DURATION_BUCKETS
+)
+
+
+def measure_stage(endpoint: str, stage: str):
+    return REQUEST_STAGE_DURATION.labels(endpoint=endpoint, stage=stage).time()
+
+
+def resolve_endpoint(scope: Scope, request_path: str) -> str:
+    # FastAPI кладет найденный APIRoute в scope, его шаблон и есть метка.
+    matched_route = scope.get("route")
+    if matched_route is not None:
+        return matched_route.path
+    # Mount (/static, /metrics) и служебные маршруты (/docs) route не выставляют,
+    # а Mount еще и переписывает scope["path"], поэтому сверяемся с исходным путем
+    route_scope = {"type": "http", "path": request_path, "method": scope["method"]}
+    for route in scope["app"].routes:
+        match, _ = route.matches(route_scope)
+        if match != Match.NONE:
+            return route.path
+    return UNMATCHED_ENDPOINT
+
+
+def record_request(scope: Scope, request_path: str, status_code: int, duration: float) -> None:
+    endpoint = resolve_endpoint(scope, request_path)
+    REQUEST_COUNTER.labels(method=scope["method"], endpoint=endpoint, status=status_code).inc()
+    REQUEST_DURATION.labels(method=scope["method"], endpoint=endpoint).observe(duration)
+
+
+class MetricsMiddleware:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_path = scope["path"]
+        start_time = time.perf_counter()
+        status_code: Optional[int] = None
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Длительность считаем до заголовков ответа: потоки (SSE, экспорт)
+                # живут сколько угодно и иначе размазали бы гистограмму
+                record_request(scope, request_path, status_code, time.perf_counter() - start_time)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        except Exception:
+            if status_code is None:
+                record_request(scope, request_path, 500, time.perf_counter() - start_time)
+            raise
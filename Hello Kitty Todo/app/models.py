@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, DateTime, func
+from sqlalchemy import Column, Integer, String, Enum, DateTime, Index, event, func
 from app.database import BaseModel
 import enum
 from datetime import datetime
@@ -30,6 +30,13 @@ class TaskModel(BaseModel):
     created_at = Column(DateTime, default=func.now(), nullable=False)
     completed_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index("ix_kitty_tasks_status_priority_created", "status", "priority", "created_at"),
+        Index("ix_kitty_tasks_category_created", "category", "created_at"),
+        Index("ix_kitty_tasks_created_at", "created_at"),
+        Index("ix_kitty_tasks_priority", "priority"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -75,4 +82,56 @@ class TaskModel(BaseModel):
             4: "#DB7093",
             5: "#C71585"
         }
-        return colors.get(self.priority, "#FF69B4")
\ No newline at end of file
+        return colors.get(self.priority, "#FF69B4")
+
+
+TASK_SEARCH_TABLE = "kitty_tasks_fts"
+
+TASK_SEARCH_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {TASK_SEARCH_TABLE} USING fts5(
+        title, description,
+        content='kitty_tasks', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TASK_SEARCH_TABLE}_ai AFTER INSERT ON kitty_tasks BEGIN
+        INSERT INTO {TASK_SEARCH_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TASK_SEARCH_TABLE}_ad AFTER DELETE ON kitty_tasks BEGIN
+        INSERT INTO {TASK_SEARCH_TABLE}({TASK_SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TASK_SEARCH_TABLE}_au AFTER UPDATE OF title, description ON kitty_tasks BEGIN
+        INSERT INTO {TASK_SEARCH_TABLE}({TASK_SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {TASK_SEARCH_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+
+def create_task_search_index(target, connection, **kwargs):
+    if connection.dialect.name != "sqlite":
+        return
+    search_table_exists = connection.exec_driver_sql(
+        f"SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = '{TASK_SEARCH_TABLE}'"
+    ).first()
+    for statement in TASK_SEARCH_DDL:
+        connection.exec_driver_sql(statement)
+    if not search_table_exists:
+        connection.exec_driver_sql(f"INSERT INTO {TASK_SEARCH_TABLE}({TASK_SEARCH_TABLE}) VALUES ('rebuild')")
+
+
+def drop_task_search_index(target, connection, **kwargs):
+    if connection.dialect.name != "sqlite":
+        return
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {TASK_SEARCH_TABLE}")
+
+
+event.listen(TaskModel.__table__, "after_create", create_task_search_index)
+event.listen(TaskModel.__table__, "before_drop", drop_task_search_index)
+
+
+class TaskCounterModel(BaseModel):
+    __tablename__ = "kitty_task_counters"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, default=0, nullable=False)
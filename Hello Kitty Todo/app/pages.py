@@ -0,0 +1,90 @@
+from typing import Any, Dict, Optional
+import gzip
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.cache import etag_matches
+from app.compression import brotli, choose_encoding
+
+PAGE_CACHE_CONTROL = "no-cache"
+
+
+def settings_fingerprint(settings: Any) -> str:
+    if hasattr(settings, "model_dump"):
+        settings_values = settings.model_dump()
+    else:
+        settings_values = {**vars(type(settings)), **vars(settings)}
+    public_values = sorted(
+        (name, repr(value)) for name, value in settings_values.items()
+        if not name.startswith("_") and not callable(value)
+    )
+    return hashlib.blake2b(repr(public_values).encode(), digest_size=8).hexdigest()
+
+
+class RenderedPage:
+
+    def __init__(self, template: Any, fingerprint: str, body: bytes):
+        self.template = template
+        self.fingerprint = fingerprint
+        self.body = body
+        self.etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        self.encoded_bodies: Dict[str, bytes] = {}
+
+    def get_encoded_body(self, encoding_name: str) -> bytes:
+        encoded_body = self.encoded_bodies.get(encoding_name)
+        if encoded_body is None:
+            if encoding_name == "br":
+                encoded_body = brotli.compress(self.body, quality=11)
+            else:
+                encoded_body = gzip.compress(self.body, 9, mtime=0)
+            self.encoded_bodies[encoding_name] = encoded_body
+        return encoded_body
+
+
+class RenderedPageCache:
+
+    def __init__(self, templates_directory: str, templates_globals: Optional[dict] = None):
+        self.templates_directory = templates_directory
+        self.templates_globals = templates_globals or {}
+        self.templates_environment = None
+        self.pages: Dict[str, RenderedPage] = {}
+
+    def get_templates_environment(self):
+        # Jinja2 импортируется при первой HTML-странице, а не при старте API
+        if self.templates_environment is None:
+            import jinja2
+            self.templates_environment = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(self.templates_directory),
+                autoescape=True
+            )
+            self.templates_environment.globals.update(self.templates_globals)
+        return self.templates_environment
+
+    def clear(self) -> None:
+        self.pages.clear()
+
+    def get_page(self, template_name: str, context: dict, settings: Any, context_key: str = "") -> RenderedPage:
+        # get_template сам сверяет mtime файла (auto_reload) и отдает новый объект,
+        # если шаблон поменялся, поэтому смена объекта и есть сигнал перерисовать
+        template = self.get_templates_environment().get_template(template_name)
+        fingerprint = f"{settings_fingerprint(settings)}:{context_key}"
+        rendered_page = self.pages.get(template_name)
+        if rendered_page is None or rendered_page.template is not template or rendered_page.fingerprint != fingerprint:
+            rendered_page = RenderedPage(template, fingerprint, template.render(context).encode("utf-8"))
+            self.pages[template_name] = rendered_page
+        return rendered_page
+
+
+def build_page_response(request: Request, rendered_page: RenderedPage, vary: str = "Accept-Encoding") -> Response:
+    headers = {"ETag": rendered_page.etag, "Cache-Control": PAGE_CACHE_CONTROL, "Vary": vary}
+    if etag_matches(request.headers.get("if-none-match"), rendered_page.etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding_name: Optional[str] = choose_encoding(request.headers.get("accept-encoding", ""))
+    if encoding_name is None:
+        return Response(content=rendered_page.body, media_type="text/html", headers=headers)
+    # Сжатая копия считается один раз на версию страницы, дальше отдается как есть
+    headers["Content-Encoding"] = encoding_name
+    return Response(content=rendered_page.get_encoded_body(encoding_name), media_type="text/html", headers=headers)
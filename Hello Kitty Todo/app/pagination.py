@@ -0,0 +1,20 @@
+import base64
+import json
+from typing import Optional
+
+
+def encode_task_cursor(last_task_id: int) -> str:
+    payload = json.dumps({"id": last_task_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_task_cursor(cursor_value: str) -> Optional[int]:
+    try:
+        padding = "=" * (-len(cursor_value) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor_value + padding))
+        task_id = payload["id"]
+    except (ValueError, TypeError, KeyError):
+        return None
+    if not isinstance(task_id, int) or isinstance(task_id, bool) or task_id < 0:
+        return None
+    return task_id
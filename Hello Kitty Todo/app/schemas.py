@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict, validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, ConfigDict, validator, model_validator
+from typing import Optional, List, Dict
 from enum import Enum
 import random
 
@@ -27,6 +27,20 @@ class KittyCategory(str, Enum):
     SHOPPING = "shopping"
 
 
+class TaskSortEnum(str, Enum):
+    ID = "id"
+    ID_DESC = "-id"
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+    PRIORITY = "priority"
+    PRIORITY_DESC = "-priority"
+
+
+class ExportFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class TaskCreateSchema(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = Field(None, max_length=1000)
@@ -52,6 +66,10 @@ class TaskCreateSchema(BaseModel):
     })
 
 
+class TasksBulkCreateSchema(BaseModel):
+    tasks: List[TaskCreateSchema] = Field(..., min_length=1, max_length=10000)
+
+
 class TaskUpdateSchema(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = Field(None, max_length=1000)
@@ -68,6 +86,31 @@ class TaskUpdateSchema(BaseModel):
     })
 
 
+class TasksFilterSchema(BaseModel):
+    status: Optional[TaskStatusEnum] = None
+    category: Optional[KittyCategory] = None
+    priority: Optional[int] = Field(None, ge=1, le=5)
+    task_ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000)
+
+    @model_validator(mode="after")
+    def require_any_filter(self):
+        if all(value is None for value in (self.status, self.category, self.priority, self.task_ids)):
+            raise ValueError("Нужен хотя бы один фильтр: status, category, priority или task_ids")
+        return self
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "status": "done",
+            "category": "school"
+        }
+    })
+
+
+class TasksBulkUpdateSchema(BaseModel):
+    filter: TasksFilterSchema
+    changes: TaskUpdateSchema
+
+
 class TaskResponseSchema(BaseModel):
     id: int
     title: str
@@ -96,7 +139,49 @@ class TasksListResponseSchema(BaseModel):
     emoji: str = "🐱🎀🌸"
     theme: str
     tasks: List[TaskResponseSchema]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
     message: str = "Вот твои кавайные задачи!"
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TasksBulkResponseSchema(BaseModel):
+    emoji: str = "🐱🎀🌸"
+    created: int
+    task_ids: List[int]
+    message: str = "Все задачи добавлены!"
+
+
+class TasksBulkResultSchema(BaseModel):
+    emoji: str = "🐱🎀🌸"
+    affected: int
+    message: str = "Готово!"
+
+
+class TasksStatsSchema(BaseModel):
+    emoji: str = "🐱🎀🌸"
+    total: int
+    completed: int
+    pending: int
+    completion_rate: float
+    by_status: Dict[str, int]
+    by_category: Dict[str, int]
+    by_priority: Dict[str, int]
+    message: str = "Вот твоя кавайная статистика!"
+
+
+class TaskImportErrorSchema(BaseModel):
+    row: int
+    message: str
+
+
+class TasksImportReportSchema(BaseModel):
+    emoji: str = "🐱🎀🌸"
+    imported: int
+    failed: int
+    errors: List[TaskImportErrorSchema]
+    errors_truncated: bool = False
+    elapsed_seconds: float
+    rows_per_second: float
+    message: str = "Импорт завершен!"
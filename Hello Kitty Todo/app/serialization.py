@@ -0,0 +1,59 @@
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from app.config import app_settings
+from app.crud import TASK_ROW_COLUMNS
+from app.models import TaskModel
+
+TASK_FIELD_NAMES = tuple(column.key for column in TASK_ROW_COLUMNS)
+
+
+# orjson сам сериализует Enum по значению и datetime в ISO 8601 (как isoformat()),
+# поэтому строки из select(*TASK_ROW_COLUMNS) превращаются в JSON без pydantic.
+def task_row_to_dict(task_row: Sequence[Any], field_names: Sequence[str] = TASK_FIELD_NAMES) -> dict:
+    return dict(zip(field_names, task_row))
+
+
+def task_to_dict(task_instance: TaskModel, field_names: Sequence[str] = TASK_FIELD_NAMES) -> dict:
+    return {field_name: getattr(task_instance, field_name) for field_name in field_names}
+
+
+def parse_task_fields(fields_value: Optional[str]) -> Tuple[str, ...]:
+    if not fields_value:
+        return TASK_FIELD_NAMES
+    requested_fields = {field_name.strip() for field_name in fields_value.split(",") if field_name.strip()}
+    unknown_fields = sorted(requested_fields - set(TASK_FIELD_NAMES))
+    if unknown_fields:
+        raise ValueError(f"Неизвестные поля: {', '.join(unknown_fields)}")
+    # id нужен всегда: по нему строится курсор и клиент узнает задачу
+    return tuple(
+        field_name for field_name in TASK_FIELD_NAMES if field_name == "id" or field_name in requested_fields
+    )
+
+
+def build_task_response(
+        task_instance: Any,
+        status_code: int = 200,
+        field_names: Sequence[str] = TASK_FIELD_NAMES,
+        headers: Optional[dict] = None
+) -> ORJSONResponse:
+    return ORJSONResponse(task_to_dict(task_instance, field_names), status_code=status_code, headers=headers)
+
+
+def dumps_tasks_list(
+        task_rows: Iterable[Sequence[Any]],
+        total: Optional[int] = None,
+        next_cursor: Optional[str] = None,
+        message: str = "Вот твои кавайные задачи!",
+        field_names: Sequence[str] = TASK_FIELD_NAMES
+) -> bytes:
+    return orjson.dumps({
+        "emoji": "🐱🎀🌸",
+        "theme": app_settings.theme.value if hasattr(app_settings.theme, 'value') else app_settings.theme,
+        "tasks": [task_row_to_dict(task_row, field_names) for task_row in task_rows],
+        "total": total,
+        "next_cursor": next_cursor,
+        "message": message,
+    })
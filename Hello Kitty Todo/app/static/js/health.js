@@ -1,10 +1,14 @@
-let autoRefreshInterval = setInterval(() => {
-    if (!document.querySelector('.refresh-button').disabled) {
-        refreshHealth();
+const HEALTH_POLL_INTERVAL_MS = 30000;
+
+// Поток задач ничего не знает о Redis и базе, поэтому статус опрашивается редко:
+// /health отдает готовый снимок фонового пробника и ничего не проверяет сам
+setInterval(() => {
+    if (!document.hidden) {
+        refreshHealth(true);
     }
-}, 10000);
+}, HEALTH_POLL_INTERVAL_MS);
 
-async function refreshHealth() {
+async function refreshHealth(silent = false) {
     try {
         const button = document.querySelector('.refresh-button');
         const loading = document.getElementById('refresh-loading');
@@ -22,7 +26,7 @@ async function refreshHealth() {
         if (response.ok) {
             if (response.headers.get('content-type')?.includes('application/json')) {
                 const data = await response.json();
-                updateHealthDisplay(data);
+                updateHealthDisplay(data, silent);
             } else {
                 location.reload();
             }
@@ -49,7 +53,7 @@ async function refreshHealth() {
     }
 }
 
-function updateHealthDisplay(data) {
+function updateHealthDisplay(data, silent = false) {
     const systemStatus = document.querySelector('.system-status');
     if (systemStatus && data.status) {
         systemStatus.className = `system-status ${getStatusClass(data.status)}`;
@@ -75,7 +79,9 @@ function updateHealthDisplay(data) {
         timestampElement.textContent = now.toLocaleTimeString('ru-RU');
     }
 
-    showHealthSuccess('Статус обновлен!');
+    if (!silent) {
+        showHealthSuccess('Статус обновлен!');
+    }
 }
 
 function updateServiceCard(serviceName, serviceData) {
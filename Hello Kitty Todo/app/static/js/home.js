@@ -1,13 +1,11 @@
 async function loadStats() {
     try {
-        const response = await fetch('/tasks');
-        const data = await response.json();
+        const response = await fetch('/tasks/stats');
+        const stats = await response.json();
 
-        if (data.tasks) {
-            document.getElementById('total-tasks').textContent = data.total || data.tasks.length;
-
-            const done = data.tasks.filter(task => task.status === 'done').length;
-            document.getElementById('done-tasks').textContent = done;
+        if (response.ok) {
+            document.getElementById('total-tasks').textContent = stats.total;
+            document.getElementById('done-tasks').textContent = stats.completed;
         }
     } catch (error) {
         console.log('Не удалось загрузить статистику:', error);
@@ -27,5 +25,26 @@ style.textContent = `
 `;
 document.head.appendChild(style);
 
-document.addEventListener('DOMContentLoaded', loadStats);
-setInterval(loadStats, 30000);
\ No newline at end of file
+let statsReloadTimer = null;
+
+function subscribeToTaskEvents() {
+    const taskEvents = new EventSource('/tasks/events');
+    let missedEvents = false;
+
+    taskEvents.onmessage = () => {
+        clearTimeout(statsReloadTimer);
+        statsReloadTimer = setTimeout(loadStats, 300);
+    };
+    taskEvents.onerror = () => { missedEvents = true; };
+    taskEvents.onopen = () => {
+        if (missedEvents) {
+            missedEvents = false;
+            loadStats();
+        }
+    };
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    loadStats();
+    subscribeToTaskEvents();
+});
\ No newline at end of file
@@ -2,18 +2,37 @@ document.addEventListener('DOMContentLoaded', function() {
     loadStats();
     setupTaskForm();
     addAnimations();
-    setInterval(loadStats, 30000);
+    subscribeToTaskEvents();
 });
 
+let statsReloadTimer = null;
+
+function subscribeToTaskEvents() {
+    const taskEvents = new EventSource('/tasks/events');
+    let missedEvents = false;
+
+    taskEvents.onmessage = () => {
+        clearTimeout(statsReloadTimer);
+        statsReloadTimer = setTimeout(loadStats, 300);
+    };
+    taskEvents.onerror = () => { missedEvents = true; };
+    taskEvents.onopen = () => {
+        if (missedEvents) {
+            missedEvents = false;
+            loadStats();
+        }
+    };
+}
+
 async function loadStats() {
     try {
-        const statsResponse = await fetch('/stats');
+        const statsResponse = await fetch('/tasks/stats');
         if (statsResponse.ok) {
             const stats = await statsResponse.json();
             updateStatsDisplay(stats);
         }
 
-        const tasksResponse = await fetch('/tasks');
+        const tasksResponse = await fetch('/tasks?fields=title,status&limit_param=3&include_total=false');
         if (tasksResponse.ok) {
             const data = await tasksResponse.json();
             updateTasksDisplay(data);
@@ -27,9 +27,52 @@ function renderStars(priority) {
     return stars;
 }
 
+const TASKS_PAGE_SIZE = 100;
+
+function renderTaskItem(task) {
+    const taskItem = document.createElement('div');
+    taskItem.className = 'task-item';
+    taskItem.dataset.taskId = task.id;
+
+    const statusClass = {
+        'todo': 'status-todo',
+        'in_progress': 'status-in-progress',
+        'done': 'status-done'
+    }[task.status] || 'status-todo';
+
+    const statusText = {
+        'todo': '📝 Сделать',
+        'in_progress': '🏃‍♀️ В процессе',
+        'done': '✅ Выполнено'
+    }[task.status] || '📝 Сделать';
+
+    const starsHTML = renderStars(task.priority || 3);
+    const categoryEmoji = categoryEmojis[task.category] || '🐱';
+    const categoryName = categoryNames[task.category] || 'Без категории';
+
+    taskItem.innerHTML = `
+        <div class="task-info">
+            <h3 class="task-title">${task.title || 'Без названия'}</h3>
+            <p class="task-description">${task.description || 'Без описания'}</p>
+            <div>
+                <span class="task-status ${statusClass}">${statusText}</span>
+                <span class="priority-stars">${starsHTML}</span>
+                <span class="task-category">${categoryEmoji} ${categoryName}</span>
+            </div>
+        </div>
+        <div class="task-actions">
+            <button onclick="updateTask(${task.id}, 'in_progress')" class="kitty-button">🏃‍♀️</button>
+            <button onclick="updateTask(${task.id}, 'done')" class="kitty-button">✅</button>
+            <button onclick="deleteTask(${task.id})" class="kitty-button delete-btn">🗑️</button>
+        </div>
+    `;
+
+    return taskItem;
+}
+
 async function loadTasks() {
     try {
-        const response = await fetch('/tasks');
+        const response = await fetch(`/tasks?limit_param=${TASKS_PAGE_SIZE}&include_total=false`);
         if (!response.ok) throw new Error('Ошибка сервера');
 
         const data = await response.json();
@@ -48,43 +91,7 @@ async function loadTasks() {
         taskList.innerHTML = '';
 
         data.tasks.forEach(task => {
-            const taskItem = document.createElement('div');
-            taskItem.className = 'task-item';
-
-            const statusClass = {
-                'todo': 'status-todo',
-                'in_progress': 'status-in-progress',
-                'done': 'status-done'
-            }[task.status] || 'status-todo';
-
-            const statusText = {
-                'todo': '📝 Сделать',
-                'in_progress': '🏃‍♀️ В процессе',
-                'done': '✅ Выполнено'
-            }[task.status] || '📝 Сделать';
-
-            const starsHTML = renderStars(task.priority || 3);
-            const categoryEmoji = categoryEmojis[task.category] || '🐱';
-            const categoryName = categoryNames[task.category] || 'Без категории';
-
-            taskItem.innerHTML = `
-                <div class="task-info">
-                    <h3 class="task-title">${task.title || 'Без названия'}</h3>
-                    <p class="task-description">${task.description || 'Без описания'}</p>
-                    <div>
-                        <span class="task-status ${statusClass}">${statusText}</span>
-                        <span class="priority-stars">${starsHTML}</span>
-                        <span class="task-category">${categoryEmoji} ${categoryName}</span>
-                    </div>
-                </div>
-                <div class="task-actions">
-                    <button onclick="updateTask(${task.id}, 'in_progress')" class="kitty-button">🏃‍♀️</button>
-                    <button onclick="updateTask(${task.id}, 'done')" class="kitty-button">✅</button>
-                    <button onclick="deleteTask(${task.id})" class="kitty-button delete-btn">🗑️</button>
-                </div>
-            `;
-
-            taskList.appendChild(taskItem);
+            taskList.appendChild(renderTaskItem(task));
         });
 
     } catch (error) {
@@ -99,6 +106,47 @@ async function loadTasks() {
     }
 }
 
+function applyTaskEvent(taskEvent) {
+    const taskList = document.getElementById('taskList');
+    const shownTasks = taskList.querySelectorAll('.task-item');
+
+    if (taskEvent.type === 'resync') {
+        loadTasks();
+        return;
+    }
+
+    if (taskEvent.type === 'deleted') {
+        const taskItem = taskList.querySelector(`[data-task-id="${taskEvent.task_id}"]`);
+        if (taskItem) taskItem.remove();
+        if (shownTasks.length <= 1) loadTasks();
+        return;
+    }
+
+    if (!taskEvent.task) return;
+
+    const taskItem = taskList.querySelector(`[data-task-id="${taskEvent.task.id}"]`);
+    if (taskItem) {
+        taskItem.replaceWith(renderTaskItem(taskEvent.task));
+    } else if (taskEvent.type === 'created' && shownTasks.length < TASKS_PAGE_SIZE) {
+        if (shownTasks.length === 0) taskList.innerHTML = '';
+        taskList.appendChild(renderTaskItem(taskEvent.task));
+    }
+}
+
+function subscribeToTaskEvents() {
+    const taskEvents = new EventSource('/tasks/events');
+    let missedEvents = false;
+
+    taskEvents.onmessage = (message) => applyTaskEvent(JSON.parse(message.data));
+    taskEvents.onerror = () => { missedEvents = true; };
+    taskEvents.onopen = () => {
+        if (missedEvents) {
+            missedEvents = false;
+            loadTasks();
+        }
+    };
+}
+
 async function createTask() {
     const title = document.getElementById('taskTitle').value.trim();
     const description = document.getElementById('taskDescription').value.trim();
@@ -125,13 +173,15 @@ async function createTask() {
         });
 
         if (response.ok) {
+            // Свою запись показываем по ответу сервера: событие SSE может уйти
+            // в другой воркер или потеряться, пока поток переподключается
+            applyTaskEvent({ type: 'created', task: await response.json() });
             document.getElementById('taskTitle').value = '';
             document.getElementById('taskDescription').value = '';
             document.getElementById('taskPriority').value = 3;
             document.getElementById('priorityStars').textContent = renderStars(3);
 
             alert('✨ Задача создана!');
-            loadTasks();
         } else {
             const error = await response.json();
             alert('😿 Ошибка: ' + (error.detail || 'Не удалось создать задачу'));
@@ -151,8 +201,8 @@ async function updateTask(taskId, newStatus) {
         });
 
         if (response.ok) {
+            applyTaskEvent({ type: 'updated', task: await response.json() });
             alert('✅ Задача обновлена!');
-            loadTasks();
         }
     } catch (error) {
         console.error('Ошибка:', error);
@@ -169,8 +219,8 @@ async function deleteTask(taskId) {
         });
 
         if (response.ok) {
+            applyTaskEvent({ type: 'deleted', task_id: taskId });
             alert('🗑️ Задача удалена!');
-            loadTasks();
         }
     } catch (error) {
         console.error('Ошибка:', error);
@@ -189,6 +239,7 @@ document.addEventListener('DOMContentLoaded', function() {
     priorityStars.textContent = renderStars(prioritySlider.value);
 
     loadTasks();
+    subscribeToTaskEvents();
 });
 
 const deleteBtnStyle = document.createElement('style');
@@ -201,5 +252,3 @@ deleteBtnStyle.textContent = `
     }
 `;
 document.head.appendChild(deleteBtnStyle);
-
-setInterval(loadTasks, 30000);
\ No newline at end of file
@@ -0,0 +1,175 @@
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
+import codecs
+import csv
+import logging
+import time
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud import async_task_crud_instance
+from app.schemas import TaskCreateSchema, TaskImportErrorSchema, TasksImportReportSchema
+
+logger_instance = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_LINE_CHARS = 1_000_000
+IMPORT_MAX_REPORTED_ERRORS = 100
+
+OVERSIZED_LINE = object()
+
+
+async def iter_text_lines(byte_chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending_text = ""
+    skipping_oversized_line = False
+
+    async for byte_chunk in byte_chunks:
+        pending_text += decoder.decode(byte_chunk)
+        *complete_lines, pending_text = pending_text.split("\n")
+        for line in complete_lines:
+            if skipping_oversized_line:
+                skipping_oversized_line = False
+                continue
+            yield line.rstrip("\r")
+        if len(pending_text) > IMPORT_MAX_LINE_CHARS:
+            if not skipping_oversized_line:
+                yield OVERSIZED_LINE
+            skipping_oversized_line = True
+            pending_text = ""
+
+    pending_text += decoder.decode(b"", final=True)
+    if pending_text and not skipping_oversized_line:
+        yield pending_text.rstrip("\r")
+
+
+async def iter_ndjson_records(lines: AsyncIterator[Any]) -> AsyncIterator[Tuple[int, Union[dict, str]]]:
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if line is OVERSIZED_LINE:
+            yield line_number, "Слишком длинная строка"
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as error:
+            yield line_number, f"Некорректный JSON: {error}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Ожидался JSON-объект"
+            continue
+        yield line_number, record
+
+
+async def iter_csv_records(lines: AsyncIterator[Any]) -> AsyncIterator[Tuple[int, Union[dict, str]]]:
+    # Запись CSV может занимать несколько строк внутри кавычек: копим строки,
+    # пока число кавычек не станет четным, и только тогда отдаем запись парсеру.
+    field_names: Optional[List[str]] = None
+    record_lines: List[str] = []
+    quotes_count = 0
+    row_number = 0
+
+    async for line in lines:
+        if line is OVERSIZED_LINE:
+            row_number += 1
+            record_lines, quotes_count = [], 0
+            yield row_number, "Слишком длинная строка"
+            continue
+        record_lines.append(line)
+        quotes_count += line.count('"')
+        if quotes_count % 2:
+            continue
+
+        record_text = "\n".join(record_lines)
+        record_lines, quotes_count = [], 0
+        if not record_text.strip():
+            continue
+        values = next(csv.reader([record_text]))
+        if field_names is None:
+            field_names = [name.strip() for name in values]
+            continue
+
+        row_number += 1
+        yield row_number, {name: value for name, value in zip(field_names, values) if value != ""}
+
+    if record_lines:
+        row_number += 1
+        yield row_number, "Незакрытые кавычки в последней записи"
+
+
+class TaskImportReport:
+
+    def __init__(self):
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[TaskImportErrorSchema] = []
+        self.started_at = time.perf_counter()
+
+    def add_error(self, row_number: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append(TaskImportErrorSchema(row=row_number, message=message))
+
+    def to_schema(self) -> TasksImportReportSchema:
+        elapsed_seconds = time.perf_counter() - self.started_at
+        processed_rows = self.imported + self.failed
+        return TasksImportReportSchema(
+            imported=self.imported,
+            failed=self.failed,
+            errors=self.errors,
+            errors_truncated=self.failed > len(self.errors),
+            elapsed_seconds=round(elapsed_seconds, 3),
+            rows_per_second=round(processed_rows / elapsed_seconds, 1) if elapsed_seconds > 0 else 0.0
+        )
+
+
+async def import_tasks(
+        database_session: Union[Session, AsyncSession],
+        byte_chunks: AsyncIterator[bytes],
+        import_format: str,
+        chunk_size: int = IMPORT_CHUNK_SIZE
+) -> TasksImportReportSchema:
+    report = TaskImportReport()
+    lines = iter_text_lines(byte_chunks)
+    records = iter_csv_records(lines) if import_format == "csv" else iter_ndjson_records(lines)
+
+    pending_rows: List[int] = []
+    pending_tasks: List[dict] = []
+
+    async def flush_pending_tasks():
+        try:
+            created_ids = await async_task_crud_instance.create_tasks_bulk(database_session, pending_tasks)
+            report.imported += len(created_ids)
+        except Exception as error:
+            logger_instance.error(f"Ошибка записи пачки импорта: {error}")
+            for row_number in pending_rows:
+                report.add_error(row_number, "Не удалось сохранить пачку задач")
+        pending_rows.clear()
+        pending_tasks.clear()
+
+    async for row_number, record in records:
+        if isinstance(record, str):
+            report.add_error(row_number, record)
+            continue
+        try:
+            validated_task = TaskCreateSchema.model_validate(record)
+        except ValidationError as error:
+            report.add_error(row_number, "; ".join(
+                f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}" for detail in error.errors()
+            ))
+            continue
+
+        pending_rows.append(row_number)
+        pending_tasks.append(validated_task.model_dump())
+        if len(pending_tasks) >= chunk_size:
+            await flush_pending_tasks()
+
+    if pending_tasks:
+        await flush_pending_tasks()
+
+    logger_instance.info(f"Импорт завершен: {report.imported} задач, {report.failed} ошибок")
+    return report.to_schema()
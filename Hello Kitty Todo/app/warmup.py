@@ -0,0 +1,61 @@
+from typing import Callable
+import asyncio
+import logging
+import random
+
+import redis
+import redis.asyncio
+
+from app import crud
+from app.config import app_settings
+from app.database import get_database_session
+
+logger_instance = logging.getLogger(__name__)
+
+REDIS_RETRY_INITIAL_DELAY_SECONDS = 0.5
+REDIS_RETRY_MAX_DELAY_SECONDS = 30.0
+
+
+def build_redis_client() -> redis.asyncio.Redis:
+    # Пул ничего не открывает при создании: первое соединение появится при первом ping
+    redis_connection_pool = redis.asyncio.ConnectionPool(
+        host=app_settings.redis_host,
+        port=app_settings.redis_port,
+        db=app_settings.redis_db,
+        password=app_settings.redis_password,
+        max_connections=app_settings.redis_max_connections,
+        socket_connect_timeout=app_settings.redis_connect_timeout_seconds,
+        socket_timeout=app_settings.redis_socket_timeout_seconds
+    )
+    return redis.asyncio.Redis(connection_pool=redis_connection_pool)
+
+
+async def connect_redis_with_backoff(
+        redis_client: redis.asyncio.Redis,
+        on_connected: Callable[[redis.asyncio.Redis], None]
+) -> None:
+    retry_delay = REDIS_RETRY_INITIAL_DELAY_SECONDS
+    attempt_number = 1
+    while True:
+        try:
+            await redis_client.ping()
+        except (redis.RedisError, OSError) as error:
+            if attempt_number == 1:
+                logger_instance.warning(f"Redis не доступен, работаем без кэша и пробуем подключиться в фоне: {error}")
+            await asyncio.sleep(retry_delay * random.uniform(0.8, 1.2))
+            retry_delay = min(retry_delay * 2, REDIS_RETRY_MAX_DELAY_SECONDS)
+            attempt_number += 1
+            continue
+        on_connected(redis_client)
+        logger_instance.info(f"Redis подключен с попытки {attempt_number}")
+        return
+
+
+async def reconcile_task_counter_in_background() -> None:
+    # Сверка делает COUNT(*) по всей таблице, поэтому идет после старта,
+    # под той же блокировкой записи, что и обычные запросы
+    try:
+        with get_database_session() as database_session:
+            await crud.async_task_crud_instance.reconcile_task_counter(database_session)
+    except Exception as error:
+        logger_instance.error(f"Не удалось сверить счетчик задач: {error}")
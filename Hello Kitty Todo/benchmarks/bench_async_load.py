@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+import os
+import tempfile
+
+from load_client import start_server, stop_server, wait_until_ready, run_load, print_header, print_result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Синхронный и асинхронный режим БД под нагрузкой")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--seed-tasks", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print_header("режим")
+    for async_mode in (False, True):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+            server_process = start_server(database_url, args.port, {"DATABASE_ASYNC_MODE": str(async_mode)})
+            try:
+                base_url = f"http://127.0.0.1:{args.port}"
+                asyncio.run(wait_until_ready(base_url))
+                result = asyncio.run(run_load(base_url, args.concurrency, args.requests, args.seed_tasks))
+            finally:
+                stop_server(server_process)
+        print_result("async" if async_mode else "sync", result)
+
+
+if __name__ == "__main__":
+    main()
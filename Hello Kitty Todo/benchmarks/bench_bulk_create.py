@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from load_client import start_server, stop_server, wait_until_ready
+
+
+def build_tasks(tasks_count, prefix):
+    return [
+        {"title": f"{prefix} {index}", "description": "Импорт из старого трекера", "priority": index % 5 + 1}
+        for index in range(tasks_count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N одиночных POST /tasks против одного POST /tasks/bulk")
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+        server_process = start_server(database_url, args.port)
+        try:
+            base_url = f"http://127.0.0.1:{args.port}"
+            asyncio.run(wait_until_ready(base_url))
+            with httpx.Client(base_url=base_url, timeout=300) as client:
+                start = time.perf_counter()
+                for task_data in build_tasks(args.tasks, "Одиночная"):
+                    client.post("/tasks", json=task_data).raise_for_status()
+                single_elapsed = time.perf_counter() - start
+
+                start = time.perf_counter()
+                client.post("/tasks/bulk", json={"tasks": build_tasks(args.tasks, "Пакетная")}).raise_for_status()
+                bulk_elapsed = time.perf_counter() - start
+        finally:
+            stop_server(server_process)
+
+    print(f"{'способ':>12} {'время, с':>10} {'задач/с':>10}")
+    print(f"{'одиночные':>12} {single_elapsed:>10.2f} {args.tasks / single_elapsed:>10.0f}")
+    print(f"{'пакет':>12} {bulk_elapsed:>10.2f} {args.tasks / bulk_elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
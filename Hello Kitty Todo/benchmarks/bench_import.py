@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import httpx
+
+from load_client import start_server, stop_server, wait_until_ready
+
+
+def generate_ndjson(rows_count):
+    for index in range(rows_count):
+        task_data = {"title": f"Импорт {index}", "description": "Из старого трекера", "priority": index % 5 + 1}
+        yield (json.dumps(task_data, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def generate_csv(rows_count):
+    yield "title,description,priority\n".encode("utf-8")
+    for index in range(rows_count):
+        yield f'Импорт {index},"Из старого трекера, строка {index}",{index % 5 + 1}\n'.encode("utf-8")
+
+
+def read_peak_memory_mb(process_id):
+    try:
+        with open(f"/proc/{process_id}/status") as status_file:
+            for line in status_file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Потоковый импорт NDJSON/CSV через POST /tasks/import")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--port", type=int, default=8768)
+    args = parser.parse_args()
+
+    results = []
+    for import_format, generate_rows in (("ndjson", generate_ndjson), ("csv", generate_csv)):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+            server_process = start_server(database_url, args.port)
+            try:
+                base_url = f"http://127.0.0.1:{args.port}"
+                asyncio.run(wait_until_ready(base_url))
+                memory_before = read_peak_memory_mb(server_process.pid)
+                with httpx.Client(base_url=base_url, timeout=600) as client:
+                    start = time.perf_counter()
+                    response = client.post(
+                        "/tasks/import",
+                        params={"format": import_format},
+                        content=generate_rows(args.rows)
+                    )
+                    response.raise_for_status()
+                    elapsed = time.perf_counter() - start
+                report = response.json()
+                memory_after = read_peak_memory_mb(server_process.pid)
+            finally:
+                stop_server(server_process)
+        results.append((import_format, report, elapsed, memory_before, memory_after))
+
+    print(f"{'формат':>8} {'строк':>8} {'ошибок':>7} {'время, с':>9} {'строк/с':>9} {'пик RSS до/после, МБ':>22}")
+    for import_format, report, elapsed, memory_before, memory_after in results:
+        print(
+            f"{import_format:>8} {report['imported']:>8} {report['failed']:>7} {elapsed:>9.2f} "
+            f"{report['rows_per_second']:>9.0f} {memory_before:>10.1f} / {memory_after:<9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import BaseModel
+from app.models import TaskModel, TaskStatus, KittyCategory
+from app.crud import task_crud_instance
+
+
+def fill_tasks(engine, rows_count, batch_size=50_000):
+    categories = list(KittyCategory)
+    statuses = list(TaskStatus)
+    with engine.begin() as connection:
+        for batch_start in range(0, rows_count, batch_size):
+            batch_end = min(batch_start + batch_size, rows_count)
+            connection.execute(insert(TaskModel), [
+                {
+                    "title": f"Задача {index} 🎀",
+                    "description": f"Описание {index}",
+                    "status": statuses[index % len(statuses)],
+                    "category": categories[index % len(categories)],
+                    "priority": index % 5 + 1,
+                }
+                for index in range(batch_start, batch_end)
+            ])
+
+
+def time_call(func, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OFFSET/LIMIT против keyset-пагинации")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(temp_dir, 'bench.db')}")
+        BaseModel.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+
+        print(f"Заполняем {args.rows} задач...")
+        fill_tasks(engine, args.rows)
+
+        pages_count = args.rows // args.limit
+        probe_pages = sorted({0, 1, 10, 100, 500, pages_count // 2, pages_count - 1} - {-1})
+
+        print(f"{'страница':>10} {'offset, мс':>12} {'keyset, мс':>12}")
+        with session_factory() as session:
+            for page_number in probe_pages:
+                if page_number >= pages_count:
+                    continue
+                skip = page_number * args.limit
+                offset_time = time_call(
+                    lambda: task_crud_instance.get_all_tasks(session, skip, args.limit), args.repeats
+                )
+                # keyset опирается на id последней задачи предыдущей страницы
+                keyset_time = time_call(
+                    lambda: task_crud_instance.get_tasks_after(session, skip, args.limit), args.repeats
+                )
+                session.expunge_all()
+                print(f"{page_number:>10} {offset_time * 1000:>12.2f} {keyset_time * 1000:>12.2f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
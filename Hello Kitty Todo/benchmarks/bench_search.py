@@ -0,0 +1,101 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import BaseModel
+from app.models import TaskModel
+from app.crud import task_crud_instance
+
+VOCABULARY = (
+    "купить молоко печенье бантик уроки реферат уборка окна кот цветы подарок торт "
+    "экзамен проект отчет встреча звонок письмо стирка посуда магазин платье туфли "
+    "книга фильм прогулка парк подруга праздник шарики открытка клубника чай"
+).split()
+
+
+def fill_tasks(engine, rows_count, batch_size=50_000):
+    word_picker = random.Random(42)
+    with engine.begin() as connection:
+        for batch_start in range(0, rows_count, batch_size):
+            batch_end = min(batch_start + batch_size, rows_count)
+            connection.execute(insert(TaskModel), [
+                {
+                    "title": " ".join(word_picker.choices(VOCABULARY, k=3)) + f" {index}",
+                    "description": " ".join(word_picker.choices(VOCABULARY, k=12)),
+                }
+                for index in range(batch_start, batch_end)
+            ])
+
+
+def like_search(session, search_query, limit):
+    pattern = f"%{search_query}%"
+    return (
+        session.query(TaskModel)
+        .filter(TaskModel.title.like(pattern) | TaskModel.description.like(pattern))
+        .limit(limit)
+        .all()
+    )
+
+
+def like_count(session, search_query):
+    pattern = f"%{search_query}%"
+    return session.execute(
+        text("SELECT count(*) FROM kitty_tasks WHERE title LIKE :pattern OR description LIKE :pattern"),
+        {"pattern": pattern}
+    ).scalar()
+
+
+def time_call(func, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FTS5 + bm25 против LIKE '%q%'")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(temp_dir, 'bench.db')}")
+        BaseModel.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+
+        print(f"Заполняем {args.rows} задач...")
+        fill_tasks(engine, args.rows)
+
+        print(f"{'запрос':>20} {'FTS стр., мс':>14} {'LIKE стр., мс':>14} {'FTS count, мс':>14} {'LIKE count, мс':>15}")
+        with session_factory() as session:
+            for search_query in ("молоко", "клубника чай", "бантик подарок торт", "несуществующее"):
+                fts_page = time_call(
+                    lambda: task_crud_instance.search_tasks(session, search_query, 0, args.limit), args.repeats
+                )
+                like_page = time_call(lambda: like_search(session, search_query, args.limit), args.repeats)
+                fts_count = time_call(
+                    lambda: task_crud_instance.count_search_results(session, search_query), args.repeats
+                )
+                like_total = time_call(lambda: like_count(session, search_query), args.repeats)
+                session.expunge_all()
+                print(
+                    f"{search_query:>20} {fts_page * 1000:>14.2f} {like_page * 1000:>14.2f} "
+                    f"{fts_count * 1000:>14.2f} {like_total * 1000:>15.2f}"
+                )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import schemas
+from app.crud import task_crud_instance
+from app.database import BaseModel
+from app.models import TaskModel
+from app.serialization import dumps_tasks_list
+from bench_pagination import fill_tasks, time_call
+
+
+def serialize_through_schemas(tasks_list):
+    # Прежний путь: from_orm на каждую задачу, модель списка, затем повторная
+    # валидация по response_model и jsonable_encoder + json.dumps, как делает FastAPI.
+    response_data = schemas.TasksListResponseSchema(
+        tasks=[schemas.TaskResponseSchema.from_orm(task) for task in tasks_list],
+        total=len(tasks_list),
+        theme="pink",
+        message="Вот твои кавайные задачи!"
+    )
+    validated_data = schemas.TasksListResponseSchema.model_validate(response_data.model_dump())
+    return json.dumps(jsonable_encoder(validated_data), ensure_ascii=False).encode("utf-8")
+
+
+def serialize_rows(task_rows):
+    return dumps_tasks_list(task_rows, len(task_rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Стоимость сериализации одной задачи: pydantic против orjson из строк")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(temp_dir, 'bench.db')}")
+        BaseModel.metadata.create_all(bind=engine)
+        fill_tasks(engine, args.limit)
+        session = sessionmaker(bind=engine)()
+
+        orm_tasks = session.query(TaskModel).order_by(TaskModel.id).limit(args.limit).all()
+        task_rows = task_crud_instance.get_all_tasks(session, 0, args.limit)
+
+        def load_and_serialize_orm():
+            session.expunge_all()
+            serialize_through_schemas(session.query(TaskModel).order_by(TaskModel.id).limit(args.limit).all())
+
+        def load_and_serialize_rows():
+            serialize_rows(task_crud_instance.get_all_tasks(session, 0, args.limit))
+
+        results = [
+            ("сериализация", time_call(lambda: serialize_through_schemas(orm_tasks), args.repeats),
+             time_call(lambda: serialize_rows(task_rows), args.repeats)),
+            ("запрос + сериализация", time_call(load_and_serialize_orm, args.repeats),
+             time_call(load_and_serialize_rows, args.repeats)),
+        ]
+        session.close()
+
+    print(f"{'этап':>22} {'pydantic, мкс/задача':>22} {'orjson, мкс/задача':>20} {'ускорение':>10}")
+    for stage_name, schemas_elapsed, rows_elapsed in results:
+        print(
+            f"{stage_name:>22} {schemas_elapsed / args.limit * 1e6:>22.1f} "
+            f"{rows_elapsed / args.limit * 1e6:>20.1f} {schemas_elapsed / rows_elapsed:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import os
+import tempfile
+
+from load_client import start_server, stop_server, wait_until_ready, run_load, print_header, print_result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Профили PRAGMA SQLite при параллельном чтении и записи")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--seed-tasks", type=int, default=200)
+    parser.add_argument("--write-every", type=int, default=3)
+    parser.add_argument("--async-mode", action="store_true")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    print_header("профиль")
+    for profile_name in ("default", "performance"):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+            server_process = start_server(database_url, args.port, {
+                "SQLITE_PRAGMA_PROFILE": profile_name,
+                "DATABASE_ASYNC_MODE": str(args.async_mode),
+            })
+            try:
+                base_url = f"http://127.0.0.1:{args.port}"
+                asyncio.run(wait_until_ready(base_url))
+                result = asyncio.run(run_load(
+                    base_url, args.concurrency, args.requests, args.seed_tasks, args.write_every
+                ))
+            finally:
+                stop_server(server_process)
+        print_result(profile_name, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+
+from load_client import PROJECT_DIR, stop_server, wait_until_ready, run_load, print_header, print_result
+
+
+def start_kitty_server(database_url, port, workers_count):
+    environment = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        REDIS_HOST="127.0.0.1",
+        REDIS_PORT="1",
+        DEBUG_MODE="False",
+        SERVER_PORT=str(port),
+        SERVER_WORKERS=str(workers_count),
+        PROMETHEUS_MULTIPROC_DIR=os.path.join(os.path.dirname(database_url.replace("sqlite:///", "")), "metrics"),
+    )
+    return subprocess.Popen(
+        [sys.executable, "run_kitty.py"],
+        cwd=PROJECT_DIR,
+        env=environment,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пропускная способность в зависимости от числа воркеров")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--seed-tasks", type=int, default=200)
+    parser.add_argument("--write-every", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"Ядер процессора: {os.cpu_count()}, запись каждым {args.write_every}-м запросом")
+    print_header("воркеров")
+    for workers_count in args.workers:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+            server_process = start_kitty_server(database_url, args.port, workers_count)
+            try:
+                base_url = f"http://127.0.0.1:{args.port}"
+                asyncio.run(wait_until_ready(base_url))
+                result = asyncio.run(run_load(
+                    base_url, args.concurrency, args.requests, args.seed_tasks, args.write_every
+                ))
+            finally:
+                stop_server(server_process)
+        print_result(str(workers_count), result)
+
+
+if __name__ == "__main__":
+    main()
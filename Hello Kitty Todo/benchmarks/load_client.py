@@ -0,0 +1,98 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server(database_url, port, extra_environment=None, extra_arguments=()):
+    environment = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        REDIS_HOST="127.0.0.1",
+        REDIS_PORT="1",
+        DEBUG_MODE="False",
+        **(extra_environment or {}),
+    )
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app_instance",
+            "--port", str(port), "--log-level", "warning", *extra_arguments,
+        ],
+        cwd=PROJECT_DIR,
+        env=environment,
+    )
+
+
+def stop_server(server_process):
+    server_process.terminate()
+    server_process.wait()
+
+
+async def wait_until_ready(base_url, timeout_seconds=30):
+    deadline = time.monotonic() + timeout_seconds
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/tasks", params={"limit_param": 1})).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Сервер не поднялся вовремя")
+
+
+async def run_load(base_url, concurrency, requests_count, seed_tasks=0, write_every=10):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        for index in range(seed_tasks):
+            await client.post("/tasks", json={"title": f"Задача {index}", "description": "Нагрузка", "priority": 3})
+
+        latencies = []
+        errors_count = 0
+        queue = asyncio.Queue()
+        for index in range(requests_count):
+            queue.put_nowait(index)
+
+        async def worker():
+            nonlocal errors_count
+            while not queue.empty():
+                index = queue.get_nowait()
+                start = time.perf_counter()
+                try:
+                    if write_every and index % write_every == 0:
+                        response = await client.post("/tasks", json={"title": f"Запись {index}", "priority": 2})
+                    else:
+                        response = await client.get("/tasks", params={"limit_param": 20, "include_total": "false"})
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors_count += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": requests_count / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        "p99": latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000 if latencies else 0.0,
+        "errors": errors_count,
+    }
+
+
+def print_header(first_column):
+    print(f"{first_column:>12} {'RPS':>10} {'p50, мс':>10} {'p99, мс':>10} {'ошибок':>8}")
+
+
+def print_result(row_name, result):
+    print(
+        f"{row_name:>12} {result['rps']:>10.1f} {result['p50']:>10.2f} "
+        f"{result['p99']:>10.2f} {result['errors']:>8}"
+    )
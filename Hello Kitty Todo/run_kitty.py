@@ -1,5 +1,6 @@
 import uvicorn
 import os
+import shutil
 import sys
 
 print("🌸🎀 Hello Kitty Todo API 🎀🌸")
@@ -7,22 +8,75 @@ print("🌸🎀 Hello Kitty Todo API 🎀🌸")
 print("\nПроверка файлов:")
 print(f"/app/app/main.py: {os.path.exists('/app/app/main.py')}")
 
+
+def prepare_prometheus_multiproc_dir(multiproc_dir):
+    # Файлы метрик прошлого запуска исказили бы счетчики, поэтому каталог каждый раз новый.
+    # Переменная должна быть выставлена до первого импорта prometheus_client.
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = multiproc_dir
+
+
+def run_workers(app_settings):
+    from gunicorn.app.base import BaseApplication
+
+    from app.main import app_instance, prepare_database
+    from app.database import database_engine
+
+    # Схему, индексы и счетчик задач готовит мастер один раз, а воркеры по флагу
+    # database_prepared пропускают это в lifespan, а не делают наперегонки.
+    # Соединения мастера не должны достаться воркерам после fork.
+    prepare_database()
+    database_engine.dispose()
+
+    def mark_worker_dead(server, worker):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+
+    class KittyWorkersApplication(BaseApplication):
+
+        def load_config(self):
+            self.cfg.set("bind", f"{app_settings.server_host}:{app_settings.server_port}")
+            self.cfg.set("workers", app_settings.server_workers)
+            self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+            # preload_app: воркеры наследуют от мастера разделяемое поколение кэша
+            self.cfg.set("preload_app", True)
+            self.cfg.set("graceful_timeout", app_settings.server_graceful_timeout_seconds)
+            self.cfg.set("max_requests", app_settings.server_max_requests)
+            self.cfg.set("max_requests_jitter", app_settings.server_max_requests // 10)
+            self.cfg.set("child_exit", mark_worker_dead)
+
+        def load(self):
+            return app_instance
+
+    print(f"🐾 Воркеров: {app_settings.server_workers}, метрики: {os.environ['PROMETHEUS_MULTIPROC_DIR']}")
+    KittyWorkersApplication().run()
+
+
 try:
     sys.path.insert(0, '/app')
 
-    from app.main import app_instance
+    from app.config import app_settings
+
+    if app_settings.server_workers > 1:
+        prepare_prometheus_multiproc_dir(app_settings.prometheus_multiproc_dir)
+        run_workers(app_settings)
+    else:
+        # Один процесс читает метрики из памяти; каталог из окружения ему не нужен
+        os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+        from app.main import app_instance
 
-    print("✅ Приложение импортировано успешно!")
+        print("✅ Приложение импортировано успешно!")
 
-    uvicorn.run(
-        app=app_instance,
-        host="0.0.0.0",
-        port=8000,
-        reload=False
-    )
+        uvicorn.run(
+            app=app_instance,
+            host=app_settings.server_host,
+            port=app_settings.server_port,
+            reload=False
+        )
 except Exception as e:
     print(f"❌ Ошибка: {e}")
     import traceback
 
     traceback.print_exc()
-    exit(1)
\ No newline at end of file
+    exit(1)
@@ -1,6 +1,7 @@
 
 import pytest
 from fastapi.testclient import TestClient
+import asyncio
 import sys
 import os
 
@@ -21,10 +22,18 @@ app.config.app_settings = type('TestSettings', (), {
     'accent_color': "#FFB6C1",
     'ribbon_color': "#FF1493",
     'database_url': "sqlite:///./test_todo.db",
+    'database_async_mode': False,
+    'sqlite_pragma_profile': "performance",
     'redis_host': "localhost",
     'redis_port': 6379,
     'redis_db': 0,
     'redis_password': None,
+    'redis_max_connections': 50,
+    'redis_connect_timeout_seconds': 1.0,
+    'redis_socket_timeout_seconds': 0.5,
+    'l1_cache_max_entries': 256,
+    'l1_cache_ttl_seconds': 2.0,
+    'health_probe_interval_seconds': 10.0,
     'enable_kitty_sounds': True,
     'kitty_emoji': "🐱🎀🌸",
     'default_bow': "pink",
@@ -33,6 +42,70 @@ app.config.app_settings = type('TestSettings', (), {
 from app.main import app_instance
 
 
+class FakeRedis:
+
+    def __init__(self):
+        self.storage = {}
+        self.commands_log = []
+        self.channel_subscribers = {}
+
+    async def get(self, key):
+        self.commands_log.append(("get", key))
+        return self.storage.get(key)
+
+    async def setex(self, key, ttl_seconds, value):
+        self.commands_log.append(("setex", key))
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self.storage[key] = value
+        return True
+
+    async def incr(self, key):
+        self.commands_log.append(("incr", key))
+        value = int(self.storage.get(key, b"0")) + 1
+        self.storage[key] = str(value).encode("utf-8")
+        return value
+
+    async def publish(self, channel, payload):
+        self.commands_log.append(("publish", channel))
+        subscribers = self.channel_subscribers.get(channel, [])
+        for pubsub in subscribers:
+            pubsub.messages.put_nowait({"type": "message", "channel": channel, "data": payload})
+        return len(subscribers)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def ping(self):
+        return True
+
+    async def aclose(self):
+        pass
+
+
+class FakePubSub:
+
+    def __init__(self, fake_redis):
+        self.fake_redis = fake_redis
+        self.messages = asyncio.Queue()
+        self.channels = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+        self.fake_redis.channel_subscribers.setdefault(channel, []).append(self)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        for channel in self.channels:
+            self.fake_redis.channel_subscribers[channel].remove(self)
+        self.channels = []
+
+
 @pytest.fixture
 def test_client():
     with TestClient(app_instance) as client:
@@ -45,4 +118,9 @@ def sample_task_data():
         "title": "Тестовая задача",
         "description": "Тестовое описание",
         "status": "todo"
-    }
\ No newline at end of file
+    }
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
@@ -0,0 +1,131 @@
+import gzip
+import json
+import pytest
+import sys
+import os
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.assets import PrecompressedStaticFiles, build_static_assets, IMMUTABLE_CACHE_CONTROL
+from app.compression import CompressionMiddleware, StreamCompressor, brotli, choose_encoding
+
+
+@pytest.fixture
+def static_directory(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "kitty.css").write_text("body { color: pink; }\n" * 200)
+    return tmp_path
+
+
+def test_build_writes_hashed_and_precompressed_assets(static_directory):
+    built_manifest = build_static_assets(static_directory)
+
+    hashed_path = built_manifest["css/kitty.css"]
+    assert hashed_path.startswith("dist/css/kitty.") and hashed_path.endswith(".css")
+    assert json.loads((static_directory / "dist" / "manifest.json").read_text()) == built_manifest
+
+    original_content = (static_directory / "css" / "kitty.css").read_bytes()
+    assert gzip.decompress((static_directory / f"{hashed_path}.gz").read_bytes()) == original_content
+    if brotli is not None:
+        assert brotli.decompress((static_directory / f"{hashed_path}.br").read_bytes()) == original_content
+
+
+def test_precompressed_static_files_serve_encoded_variant(static_directory):
+    built_manifest = build_static_assets(static_directory)
+    static_app = FastAPI()
+    static_app.mount("/static", PrecompressedStaticFiles(directory=static_directory), name="static")
+    static_client = TestClient(static_app)
+    hashed_url = f"/static/{built_manifest['css/kitty.css']}"
+
+    gzip_response = static_client.get(hashed_url, headers={"Accept-Encoding": "gzip"})
+    assert gzip_response.headers["content-encoding"] == "gzip"
+    assert gzip_response.headers["content-type"].startswith("text/css")
+    assert gzip_response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert gzip_response.text == (static_directory / "css" / "kitty.css").read_text()
+
+    if brotli is not None:
+        brotli_response = static_client.get(hashed_url, headers={"Accept-Encoding": "gzip, br"})
+        assert brotli_response.headers["content-encoding"] == "br"
+
+    plain_response = static_client.get(hashed_url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain_response.headers
+    assert plain_response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    source_response = static_client.get("/static/css/kitty.css")
+    assert source_response.headers["cache-control"] == "no-cache"
+
+
+def test_choose_encoding_respects_client_preferences():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, deflate") is None
+    assert choose_encoding("") is None
+    if brotli is not None:
+        assert choose_encoding("gzip, br") == "br"
+
+
+def build_compressed_client():
+    compressed_app = FastAPI()
+    compressed_app.add_middleware(CompressionMiddleware)
+
+    @compressed_app.get("/large")
+    def get_large():
+        return Response("котик " * 1000, media_type="application/json", headers={"ETag": '"kitty"'})
+
+    @compressed_app.get("/small")
+    def get_small():
+        return PlainTextResponse("мяу")
+
+    @compressed_app.get("/stream")
+    def get_stream():
+        return StreamingResponse(iter([b"data: 1\n\n", b"data: 2\n\n"]), media_type="text/event-stream")
+
+    async def already_compressed_app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"Content-Type", b"text/plain"), (b"Content-Encoding", b"gzip")],
+        })
+        await send({"type": "http.response.body", "body": gzip.compress(b"kitty" * 1000)})
+
+    compressed_app.mount("/compressed", already_compressed_app)
+    return TestClient(compressed_app)
+
+
+def test_compression_middleware_compresses_only_large_bodies():
+    compressed_client = build_compressed_client()
+
+    large_response = compressed_client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert large_response.headers["content-encoding"] == "gzip"
+    assert large_response.headers["vary"] == "Accept-Encoding"
+    assert large_response.headers["etag"] == 'W/"kitty"'
+    assert int(large_response.headers["content-length"]) < len(large_response.content)
+    assert large_response.text == "котик " * 1000
+
+    small_response = compressed_client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small_response.headers
+
+    stream_response = compressed_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in stream_response.headers
+    assert stream_response.text == "data: 1\n\ndata: 2\n\n"
+
+    compressed_response = compressed_client.get("/compressed", headers={"Accept-Encoding": "gzip"})
+    assert compressed_response.headers["content-encoding"] == "gzip"
+    assert compressed_response.text == "kitty" * 1000
+
+
+@pytest.mark.parametrize("encoding_name", ["gzip", "br"])
+def test_stream_compressor_flushes_every_chunk(encoding_name):
+    if encoding_name == "br" and brotli is None:
+        pytest.skip("нет пакета brotli")
+    stream_compressor = StreamCompressor(encoding_name)
+    decompressor = brotli.Decompressor() if encoding_name == "br" else zlib.decompressobj(31)
+    decompress = decompressor.process if encoding_name == "br" else decompressor.decompress
+
+    # Каждая часть потока должна распаковываться сразу, не дожидаясь конца ответа
+    assert decompress(stream_compressor.compress(b"data: 1\n\n", finish=False)) == b"data: 1\n\n"
+    assert decompress(stream_compressor.compress(b"data: 2\n\n", finish=True)) == b"data: 2\n\n"
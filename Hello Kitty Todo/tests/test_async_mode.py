@@ -0,0 +1,55 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import response_cache_instance
+from app.database import BaseModel, database_engine, get_db_dependency, get_async_db_dependency
+from app.main import app_instance
+
+test_client = TestClient(app_instance)
+
+
+@pytest.fixture(autouse=True)
+def async_database_mode():
+    received_sessions = []
+
+    async def override_get_db():
+        async for session in get_async_db_dependency():
+            received_sessions.append(session)
+            yield session
+
+    BaseModel.metadata.create_all(bind=database_engine)
+    response_cache_instance.local_cache.clear()
+    previous_override = app_instance.dependency_overrides.get(get_db_dependency)
+    app_instance.dependency_overrides[get_db_dependency] = override_get_db
+    yield received_sessions
+    if previous_override is None:
+        app_instance.dependency_overrides.pop(get_db_dependency, None)
+    else:
+        app_instance.dependency_overrides[get_db_dependency] = previous_override
+    BaseModel.metadata.drop_all(bind=database_engine)
+
+
+def test_crud_through_async_session(async_database_mode):
+    response = test_client.post("/tasks", json={"title": "Асинхронная задача", "status": "todo"})
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+
+    response = test_client.patch(f"/tasks/{task_id}", json={"status": "done"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "done"
+
+    response = test_client.get("/tasks")
+    assert response.json()["total"] == 1
+    assert response.json()["tasks"][0]["id"] == task_id
+
+    assert test_client.delete(f"/tasks/{task_id}").status_code == 204
+    assert test_client.get(f"/tasks/{task_id}").status_code == 404
+
+    assert async_database_mode
+    assert all(isinstance(session, AsyncSession) for session in async_database_mode)
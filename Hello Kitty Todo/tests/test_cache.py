@@ -0,0 +1,226 @@
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+import redis
+from fastapi.testclient import TestClient
+
+from app.cache import response_cache_instance, LocalLRUCache, ResponseCache, L1_CACHE_EVENTS, CACHE_KEY_PREFIX
+from app.database import BaseModel, database_engine
+from app.main import app_instance
+from app.serialization import TASK_FIELD_NAMES
+
+test_client = TestClient(app_instance)
+
+
+@pytest.fixture(autouse=True)
+def attached_cache(fake_redis):
+    BaseModel.metadata.create_all(bind=database_engine)
+    response_cache_instance.attach(fake_redis)
+    yield fake_redis
+    response_cache_instance.detach()
+    BaseModel.metadata.drop_all(bind=database_engine)
+
+
+def test_list_is_cached_as_json_bytes(attached_cache):
+    test_client.post("/tasks", json={"title": "Кэшируемая задача", "status": "todo"})
+
+    first_response = test_client.get("/tasks")
+    assert first_response.status_code == 200
+
+    cached_keys = [key for key in attached_cache.storage if key.startswith(f"{CACHE_KEY_PREFIX}:tasks:g")]
+    assert len(cached_keys) == 1
+    assert orjson.loads(attached_cache.storage[cached_keys[0]]) == first_response.json()
+
+    second_response = test_client.get("/tasks")
+    assert second_response.content == attached_cache.storage[cached_keys[0]]
+    assert second_response.headers["content-type"] == "application/json"
+
+
+def test_cached_payload_is_never_evaluated(attached_cache):
+    cache_key = response_cache_instance.build_list_key("g0", 0, 100, "", 1, "id", "", ",".join(TASK_FIELD_NAMES))
+    attached_cache.storage[cache_key] = b'{"tasks": [], "total": 0, "theme": "kuromi"}'
+
+    response = test_client.get("/tasks")
+    assert response.json()["theme"] == "kuromi"
+
+
+def test_create_is_visible_on_next_read(attached_cache):
+    test_client.get("/tasks")
+    test_client.post("/tasks", json={"title": "Новая задача", "status": "todo"})
+
+    response = test_client.get("/tasks")
+    assert len(response.json()["tasks"]) == 1
+
+
+def test_update_is_visible_on_next_read(attached_cache):
+    task_id = test_client.post("/tasks", json={"title": "Задача", "status": "todo"}).json()["id"]
+    assert test_client.get("/tasks").json()["tasks"][0]["status"] == "todo"
+
+    test_client.patch(f"/tasks/{task_id}", json={"status": "done"})
+
+    assert test_client.get("/tasks").json()["tasks"][0]["status"] == "done"
+
+
+def test_delete_is_visible_on_next_read(attached_cache):
+    task_id = test_client.post("/tasks", json={"title": "Задача", "status": "todo"}).json()["id"]
+    assert len(test_client.get("/tasks").json()["tasks"]) == 1
+
+    test_client.delete(f"/tasks/{task_id}")
+
+    assert test_client.get("/tasks").json()["tasks"] == []
+
+
+def test_stats_are_cached_and_invalidated_on_write(attached_cache):
+    task_id = test_client.post("/tasks", json={"title": "Задача", "status": "todo"}).json()["id"]
+    assert test_client.get("/tasks/stats").json()["completed"] == 0
+    assert any(key.endswith(":stats") for key in attached_cache.storage)
+
+    test_client.patch(f"/tasks/{task_id}", json={"status": "done"})
+
+    assert test_client.get("/tasks/stats").json()["completed"] == 1
+
+
+def test_write_bumps_generation_with_single_incr(attached_cache):
+    test_client.get("/tasks")
+    attached_cache.commands_log.clear()
+
+    test_client.post("/tasks", json={"title": "Задача", "status": "todo"})
+
+    write_commands = [command[0] for command in attached_cache.commands_log]
+    assert write_commands == ["incr"]
+
+
+def test_hot_page_is_served_from_l1_without_redis(attached_cache):
+    test_client.post("/tasks", json={"title": "Задача", "status": "todo"})
+    first_response = test_client.get("/tasks")
+    attached_cache.commands_log.clear()
+
+    second_response = test_client.get("/tasks")
+
+    assert second_response.content == first_response.content
+    assert attached_cache.commands_log == []
+
+
+def test_l1_evicts_least_recently_used():
+    local_cache = LocalLRUCache(max_entries=2, ttl_seconds=60)
+    evictions_before = L1_CACHE_EVENTS.labels(event="eviction")._value.get()
+
+    local_cache.set("a", b"1")
+    local_cache.set("b", b"2")
+    local_cache.get("a")
+    local_cache.set("c", b"3")
+
+    assert local_cache.get("b") is None
+    assert local_cache.get("a") == b"1"
+    assert local_cache.get("c") == b"3"
+    assert L1_CACHE_EVENTS.labels(event="eviction")._value.get() == evictions_before + 1
+
+
+def test_l1_entries_expire():
+    current_time = [100.0]
+    local_cache = LocalLRUCache(max_entries=10, ttl_seconds=5, clock=lambda: current_time[0])
+
+    local_cache.set("a", b"1")
+    current_time[0] += 4
+    assert local_cache.get("a") == b"1"
+    current_time[0] += 2
+    assert local_cache.get("a") is None
+
+
+def test_l1_counters_are_exposed_in_metrics():
+    response = test_client.get("/metrics/")
+    assert "kitty_l1_cache_events_total" in response.text
+
+
+def test_update_and_delete_bump_generation_with_single_incr(attached_cache):
+    task_id = test_client.post("/tasks", json={"title": "Задача", "status": "todo"}).json()["id"]
+
+    attached_cache.commands_log.clear()
+    test_client.put(f"/tasks/{task_id}", json={"priority": 4})
+    assert [command[0] for command in attached_cache.commands_log] == ["incr"]
+
+    attached_cache.commands_log.clear()
+    test_client.delete(f"/tasks/{task_id}")
+    assert [command[0] for command in attached_cache.commands_log] == ["incr"]
+
+
+def test_degraded_redis_falls_back_to_database(attached_cache):
+    async def timing_out_command(*args, **kwargs):
+        raise redis.TimeoutError("Timeout reading from socket")
+
+    test_client.post("/tasks", json={"title": "Задача", "status": "todo"})
+    attached_cache.get = timing_out_command
+    attached_cache.setex = timing_out_command
+    attached_cache.incr = timing_out_command
+
+    response = test_client.get("/tasks")
+    assert response.status_code == 200
+    assert len(response.json()["tasks"]) == 1
+
+    response = test_client.post("/tasks", json={"title": "Еще задача", "status": "todo"})
+    assert response.status_code == 201
+    assert len(test_client.get("/tasks").json()["tasks"]) == 2
+
+
+def test_local_generation_does_not_repeat_after_restart():
+    cache_before_restart = ResponseCache(LocalLRUCache(16, 60.0))
+    cache_after_restart = ResponseCache(LocalLRUCache(16, 60.0))
+
+    assert cache_before_restart.local_generation == cache_after_restart.local_generation == 0
+    key_before = asyncio.run(cache_before_restart.current_list_key("page"))
+    assert asyncio.run(cache_after_restart.current_list_key("page")) != key_before
+
+
+def test_redis_error_falls_back_to_separate_generation_namespace(attached_cache):
+    redis_key = asyncio.run(response_cache_instance.current_list_key("page"))
+    response_cache_instance.local_cache.clear()
+
+    async def timing_out_get(*args, **kwargs):
+        raise redis.TimeoutError("Timeout reading from socket")
+
+    attached_cache.get = timing_out_get
+    fallback_key = asyncio.run(response_cache_instance.current_list_key("page"))
+
+    assert redis_key.startswith(f"{CACHE_KEY_PREFIX}:tasks:g")
+    assert fallback_key.startswith(f"{CACHE_KEY_PREFIX}:tasks:l{response_cache_instance.boot_id}:")
+
+
+def test_generation_read_racing_a_write_is_not_kept_in_l1(attached_cache):
+    response_cache_instance.local_cache.clear()
+    original_get = attached_cache.get
+
+    async def get_racing_a_write(key):
+        generation = await original_get(key)
+        # Пока чтение поколения ждет Redis, этот же процесс записывает задачу
+        await response_cache_instance.invalidate_task_lists()
+        return generation
+
+    attached_cache.get = get_racing_a_write
+    asyncio.run(response_cache_instance.current_list_key("page"))
+    attached_cache.get = original_get
+
+    assert asyncio.run(response_cache_instance.current_list_key("page")) == f"{CACHE_KEY_PREFIX}:tasks:g1:page"
+
+
+def test_failed_generation_bump_is_retried_before_serving_from_redis(attached_cache):
+    test_client.post("/tasks", json={"title": "Задача", "status": "todo"})
+    assert test_client.get("/tasks").json()["total"] == 1
+    original_incr = attached_cache.incr
+
+    async def failing_incr(*args, **kwargs):
+        raise redis.ConnectionError("Redis перезапускается")
+
+    attached_cache.incr = failing_incr
+    test_client.post("/tasks", json={"title": "Вторая", "status": "todo"})
+    generation_before_recovery = attached_cache.storage.get(response_cache_instance.build_generation_key())
+    assert test_client.get("/tasks").json()["total"] == 2
+
+    attached_cache.incr = original_incr
+    assert test_client.get("/tasks").json()["total"] == 2
+    assert attached_cache.storage.get(response_cache_instance.build_generation_key()) != generation_before_recovery
+    assert response_cache_instance.pending_generation_bumps.value == 0
@@ -0,0 +1,158 @@
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+import redis
+from fastapi.testclient import TestClient
+
+import app.warmup
+from app.database import BaseModel, database_engine
+from app.events import (
+    TaskEventBroadcaster,
+    task_event_broadcaster_instance,
+    stream_task_events,
+    EVENT_QUEUE_SIZE,
+    TASK_EVENTS_CHANNEL,
+)
+from app.main import app_instance
+
+test_client = TestClient(app_instance)
+
+
+@pytest.fixture
+def subscriber_queue():
+    BaseModel.metadata.create_all(bind=database_engine)
+    subscriber_queue = task_event_broadcaster_instance.subscribe()
+    yield subscriber_queue
+    task_event_broadcaster_instance.unsubscribe(subscriber_queue)
+    BaseModel.metadata.drop_all(bind=database_engine)
+
+
+def drain_events(subscriber_queue):
+    events = []
+    while not subscriber_queue.empty():
+        events.append(orjson.loads(subscriber_queue.get_nowait()))
+    return events
+
+
+def test_writes_publish_task_deltas(subscriber_queue):
+    created_task = test_client.post("/tasks", json={"title": "Событие", "status": "todo"}).json()
+    test_client.patch(f"/tasks/{created_task['id']}", json={"status": "done"})
+    test_client.delete(f"/tasks/{created_task['id']}")
+    test_client.post("/tasks/bulk", json={"tasks": [{"title": "Пакет"}]})
+
+    events = drain_events(subscriber_queue)
+    assert [event["type"] for event in events] == ["created", "updated", "deleted", "resync"]
+    assert events[0]["task"] == created_task
+    assert events[1]["task"]["status"] == "done"
+    assert events[2]["task_id"] == created_task["id"]
+
+
+def test_reads_publish_nothing(subscriber_queue):
+    test_client.get("/tasks")
+    test_client.get("/tasks/stats")
+    assert drain_events(subscriber_queue) == []
+
+
+def test_slow_subscriber_gets_single_resync():
+    broadcaster = TaskEventBroadcaster()
+
+    async def overflow_queue():
+        subscriber_queue = broadcaster.subscribe()
+        for task_id in range(EVENT_QUEUE_SIZE + 5):
+            await broadcaster.publish_deleted(task_id)
+        return drain_events(subscriber_queue)
+
+    events = asyncio.run(overflow_queue())
+    assert events[0] == {"type": "resync"}
+    assert len(events) == 5
+
+
+def test_event_stream_formats_sse_and_stops_on_disconnect():
+    async def read_stream():
+        disconnected = asyncio.Event()
+
+        async def is_disconnected():
+            return disconnected.is_set()
+
+        event_stream = stream_task_events(is_disconnected)
+        chunks = [await event_stream.__anext__()]
+        next_chunk = asyncio.ensure_future(event_stream.__anext__())
+        await asyncio.sleep(0)
+        await task_event_broadcaster_instance.publish_deleted(7)
+        chunks.append(await next_chunk)
+
+        disconnected.set()
+        with pytest.raises(StopAsyncIteration):
+            await event_stream.__anext__()
+        return chunks
+
+    chunks = asyncio.run(read_stream())
+    assert chunks[0].startswith(b"retry: ")
+    assert chunks[1] == b'data: {"type":"deleted","task_id":7}\n\n'
+    assert task_event_broadcaster_instance.subscribers == set()
+
+
+def test_redis_fans_out_between_workers(fake_redis):
+    async def publish_from_first_worker():
+        first_worker, second_worker = TaskEventBroadcaster(), TaskEventBroadcaster()
+        first_worker.attach(fake_redis)
+        second_worker.attach(fake_redis)
+        await asyncio.sleep(0)
+        second_queue = second_worker.subscribe()
+
+        await first_worker.publish_deleted(3)
+        payload = await asyncio.wait_for(second_queue.get(), timeout=1)
+
+        await first_worker.detach()
+        await second_worker.detach()
+        return payload
+
+    assert orjson.loads(asyncio.run(publish_from_first_worker())) == {"type": "deleted", "task_id": 3}
+    assert ("publish", TASK_EVENTS_CHANNEL) in fake_redis.commands_log
+    assert fake_redis.channel_subscribers[TASK_EVENTS_CHANNEL] == []
+
+
+
+def test_lost_subscription_resubscribes_when_redis_returns(fake_redis, monkeypatch):
+    monkeypatch.setattr(app.warmup, "REDIS_RETRY_INITIAL_DELAY_SECONDS", 0.001)
+    create_pubsub = fake_redis.pubsub
+    created_pubsubs = []
+
+    async def broken_connection(*args, **kwargs):
+        raise redis.ConnectionError("Redis перезапускается")
+
+    def flaky_pubsub():
+        # Первая подписка обрывается, две следующие не проходят, четвертая работает
+        pubsub = create_pubsub()
+        created_pubsubs.append(pubsub)
+        if len(created_pubsubs) == 1:
+            pubsub.get_message = broken_connection
+        elif len(created_pubsubs) <= 3:
+            pubsub.subscribe = broken_connection
+        return pubsub
+
+    monkeypatch.setattr(fake_redis, "pubsub", flaky_pubsub)
+
+    async def lose_and_restore_redis():
+        broadcaster = TaskEventBroadcaster()
+        subscriber_queue = broadcaster.subscribe()
+        broadcaster.attach(fake_redis)
+
+        events = [orjson.loads(await asyncio.wait_for(subscriber_queue.get(), timeout=1)) for _ in range(2)]
+        assert broadcaster.redis_client is fake_redis
+
+        await broadcaster.publish_deleted(5)
+        events.append(orjson.loads(await asyncio.wait_for(subscriber_queue.get(), timeout=1)))
+        await broadcaster.detach()
+        return events
+
+    events = asyncio.run(lose_and_restore_redis())
+
+    assert events == [{"type": "resync"}, {"type": "resync"}, {"type": "deleted", "task_id": 5}]
+    assert len(created_pubsubs) == 4
+    assert ("publish", TASK_EVENTS_CHANNEL) in fake_redis.commands_log
@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+import app.health
+from app.database import BaseModel, database_engine
+from app.health import HealthProber, health_prober_instance
+from app.main import app_instance
+
+test_client = TestClient(app_instance)
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    BaseModel.metadata.create_all(bind=database_engine)
+    yield
+    BaseModel.metadata.drop_all(bind=database_engine)
+
+
+def get_health_check_count(dependency):
+    return REGISTRY.get_sample_value(
+        "kitty_health_check_duration_seconds_count", {"dependency": dependency}
+    ) or 0.0
+
+
+def test_probe_reports_dependencies_and_records_latency(fake_redis):
+    health_prober = HealthProber()
+    health_prober.redis_client = fake_redis
+    redis_checks_before = get_health_check_count("redis")
+    database_checks_before = get_health_check_count("database")
+
+    health_status = asyncio.run(health_prober.probe())
+
+    assert health_status["status"] == "healthy ❤️"
+    assert health_status["services"]["redis"]["status"] == "connected"
+    assert health_status["services"]["database"]["status"] == "connected"
+    assert get_health_check_count("redis") == redis_checks_before + 1
+    assert get_health_check_count("database") == database_checks_before + 1
+
+
+def test_slow_redis_times_out_as_degraded(fake_redis, monkeypatch):
+    async def slow_ping():
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(app.health, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.05)
+    monkeypatch.setattr(fake_redis, "ping", slow_ping)
+    health_prober = HealthProber()
+    health_prober.redis_client = fake_redis
+
+    health_status = asyncio.run(health_prober.probe())
+
+    assert health_status["status"] == "degraded ⚠️"
+    assert health_status["services"]["redis"]["status"] == "error"
+    assert health_status["services"]["database"]["status"] == "connected"
+
+
+def test_health_endpoint_serves_snapshot_without_io(monkeypatch):
+    asyncio.run(health_prober_instance.probe())
+    snapshot_timestamp = health_prober_instance.health_status["timestamp"]
+
+    def fail_check():
+        raise AssertionError("/health не должен ходить в базу")
+
+    monkeypatch.setattr(app.health, "check_database", fail_check)
+    response = test_client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["timestamp"] == snapshot_timestamp
+    assert response.json()["services"]["database"]["status"] == "connected"
+
+
+def test_background_prober_refreshes_snapshot(monkeypatch):
+    async def run_prober_briefly():
+        health_prober = HealthProber()
+        monkeypatch.setattr(app.health.app_settings, "health_probe_interval_seconds", 0.01, raising=False)
+        health_prober.start(None)
+        await asyncio.sleep(0.05)
+        first_timestamp = health_prober.health_status["timestamp"]
+        await asyncio.sleep(0.05)
+        await health_prober.stop()
+        return first_timestamp, health_prober
+
+    first_timestamp, health_prober = asyncio.run(run_prober_briefly())
+
+    assert health_prober.prober_task is None
+    assert health_prober.health_status["timestamp"] != first_timestamp
@@ -0,0 +1,91 @@
+import itertools
+import pytest
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from app.crud import task_crud_instance
+from app.database import BaseModel, database_engine, SessionLocal
+from app.schemas import TaskSortEnum
+
+FILTER_EXAMPLES = {
+    "status": "todo",
+    "category": "school",
+    "priority": 3,
+    "priority_min": 2,
+    "priority_max": 4,
+    "created_from": datetime(2024, 1, 1),
+    "created_to": datetime(2025, 1, 1),
+    "task_ids": [1, 2, 3],
+}
+FILTER_SHAPES = [{}] + [{name: value} for name, value in FILTER_EXAMPLES.items()] + [
+    {"status": "in_progress", "priority_min": 2, "priority_max": 4},
+    {"category": "home", "created_from": datetime(2024, 1, 1), "created_to": datetime(2025, 1, 1)},
+]
+SUPPORTED_QUERY_SHAPES = list(itertools.product(FILTER_SHAPES, [sort.value for sort in TaskSortEnum]))
+
+
+@pytest.fixture
+def database_session():
+    BaseModel.metadata.create_all(bind=database_engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+    BaseModel.metadata.drop_all(bind=database_engine)
+
+
+def explain_executed_selects(database_session, crud_call):
+    captured_statements = []
+
+    def capture_statement(connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured_statements.append((statement, parameters))
+
+    event.listen(database_engine, "before_cursor_execute", capture_statement)
+    try:
+        crud_call()
+    finally:
+        event.remove(database_engine, "before_cursor_execute", capture_statement)
+
+    plans = []
+    raw_connection = database_session.connection().connection
+    for statement, parameters in captured_statements:
+        cursor = raw_connection.cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plans.append([row[3] for row in cursor.fetchall()])
+        cursor.close()
+    return plans
+
+
+@pytest.mark.parametrize("filters,sort", SUPPORTED_QUERY_SHAPES)
+def test_list_query_uses_index(database_session, filters, sort):
+    plans = explain_executed_selects(
+        database_session,
+        lambda: task_crud_instance.get_all_tasks(database_session, 0, 20, filters, sort)
+    )
+
+    assert plans
+    for plan in plans:
+        sorted_in_memory = any("TEMP B-TREE" in step for step in plan)
+        for step in plan:
+            if not step.startswith("SCAN kitty_tasks"):
+                continue
+            # Проход таблицы допустим, только если он уже идет в порядке сортировки
+            # и обрывается на LIMIT: по индексу или по rowid для сортировки по id
+            assert not sorted_in_memory, plan
+            assert "INDEX" in step or sort.lstrip("-") == "id", plan
+
+
+@pytest.mark.parametrize("filters", [filters for filters in FILTER_SHAPES if filters])
+def test_filtered_count_uses_index(database_session, filters):
+    plans = explain_executed_selects(
+        database_session,
+        lambda: task_crud_instance.count_tasks(database_session, filters)
+    )
+
+    for plan in plans:
+        assert not any(step.startswith("SCAN kitty_tasks") and "INDEX" not in step for step in plan), plan
@@ -0,0 +1,69 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.database import BaseModel, database_engine
+from app.main import app_instance
+
+test_client = TestClient(app_instance)
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    BaseModel.metadata.create_all(bind=database_engine)
+    yield
+    BaseModel.metadata.drop_all(bind=database_engine)
+
+
+def get_request_count(method, endpoint, status_code):
+    return REGISTRY.get_sample_value(
+        "http_requests_total", {"method": method, "endpoint": endpoint, "status": str(status_code)}
+    ) or 0.0
+
+
+def get_stage_count(endpoint, stage):
+    return REGISTRY.get_sample_value(
+        "kitty_request_stage_duration_seconds_count", {"endpoint": endpoint, "stage": stage}
+    ) or 0.0
+
+
+def test_requests_are_labelled_by_route_template():
+    first_task = test_client.post("/tasks", json={"title": "Метка"}).json()
+    second_task = test_client.post("/tasks", json={"title": "Еще метка"}).json()
+    count_before = get_request_count("GET", "/tasks/{task_id}", 200)
+
+    test_client.get(f"/tasks/{first_task['id']}")
+    test_client.get(f"/tasks/{second_task['id']}")
+
+    assert get_request_count("GET", "/tasks/{task_id}", 200) == count_before + 2
+    assert get_request_count("GET", f"/tasks/{first_task['id']}", 200) == 0.0
+
+
+def test_mounts_and_unknown_paths_do_not_create_new_series():
+    static_before = get_request_count("GET", "/static", 200)
+    unmatched_before = get_request_count("GET", "unmatched", 404)
+
+    test_client.get("/static/css/kitty-theme.css")
+    test_client.get("/no-such-kitty-page-12345")
+
+    assert get_request_count("GET", "/static", 200) == static_before + 1
+    assert get_request_count("GET", "unmatched", 404) == unmatched_before + 1
+    assert get_request_count("GET", "/no-such-kitty-page-12345", 404) == 0.0
+
+
+def test_task_list_records_stage_durations():
+    test_client.post("/tasks", json={"title": "Этапы"})
+    stages_before = {
+        stage: get_stage_count("/tasks", stage)
+        for stage in ("cache_generation", "cache_lookup", "db_query", "serialization", "cache_store")
+    }
+
+    test_client.get("/tasks")
+
+    for stage, count_before in stages_before.items():
+        assert get_stage_count("/tasks", stage) == count_before + 1
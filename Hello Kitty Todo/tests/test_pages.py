@@ -0,0 +1,83 @@
+import gzip
+import os
+import pytest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import app.main
+from app.main import app_instance, rendered_page_cache_instance
+from app.pages import RenderedPageCache
+
+test_client = TestClient(app_instance)
+
+HTML_HEADERS = {"Accept": "text/html", "Accept-Encoding": "identity"}
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    rendered_page_cache_instance.clear()
+    yield
+    rendered_page_cache_instance.clear()
+
+
+def test_pages_are_rendered_once_and_revalidated_with_etag():
+    first_response = test_client.get("/kitty/tasks-ui", headers=HTML_HEADERS)
+    cached_page = rendered_page_cache_instance.pages["tasks-ui.html"]
+    second_response = test_client.get("/kitty/tasks-ui", headers=HTML_HEADERS)
+
+    assert first_response.status_code == 200
+    assert first_response.content == second_response.content
+    assert rendered_page_cache_instance.pages["tasks-ui.html"] is cached_page
+    assert first_response.headers["etag"] == cached_page.etag
+    assert first_response.headers["cache-control"] == "no-cache"
+
+    not_modified_response = test_client.get(
+        "/kitty/tasks-ui", headers={**HTML_HEADERS, "If-None-Match": cached_page.etag}
+    )
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+
+
+def test_root_page_serves_precompressed_bytes():
+    response = test_client.get("/", headers={"Accept": "text/html", "Accept-Encoding": "gzip"})
+    cached_page = rendered_page_cache_instance.pages["index.html"]
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept, Accept-Encoding"
+    assert cached_page.encoded_bodies["gzip"] == gzip.compress(cached_page.body, 9, mtime=0)
+    assert response.content == cached_page.body
+
+
+def test_settings_change_invalidates_page(monkeypatch):
+    test_client.get("/", headers=HTML_HEADERS)
+    first_page = rendered_page_cache_instance.pages["index.html"]
+    test_client.get("/", headers=HTML_HEADERS)
+    assert rendered_page_cache_instance.pages["index.html"] is first_page
+
+    monkeypatch.setattr(app.main.app_settings, "primary_color", "#000000", raising=False)
+    test_client.get("/", headers=HTML_HEADERS)
+    second_page = rendered_page_cache_instance.pages["index.html"]
+
+    assert second_page is not first_page
+    assert second_page.fingerprint != first_page.fingerprint
+
+
+def test_template_file_change_invalidates_page(tmp_path):
+    template_path = tmp_path / "page.html"
+    template_path.write_text("<p>{{ greeting }}</p>")
+    page_cache = RenderedPageCache(str(tmp_path))
+    settings = type("PageSettings", (), {"theme": "hello_kitty"})()
+
+    first_page = page_cache.get_page("page.html", {"greeting": "мяу"}, settings)
+    assert page_cache.get_page("page.html", {"greeting": "мяу"}, settings) is first_page
+
+    template_path.write_text("<h1>{{ greeting }}</h1>")
+    os.utime(template_path, (template_path.stat().st_mtime + 10, template_path.stat().st_mtime + 10))
+    second_page = page_cache.get_page("page.html", {"greeting": "мяу"}, settings)
+
+    assert second_page is not first_page
+    assert second_page.body == "<h1>мяу</h1>".encode()
+    assert second_page.etag != first_page.etag
@@ -0,0 +1,86 @@
+import asyncio
+import socket
+import subprocess
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import redis
+
+import app.warmup
+from app.warmup import connect_redis_with_backoff
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HUNG_REDIS_TIMEOUT_SECONDS = 20
+STARTUP_BUDGET_SECONDS = 15
+
+
+def find_free_port():
+    with socket.socket() as probe_socket:
+        probe_socket.bind(("127.0.0.1", 0))
+        return probe_socket.getsockname()[1]
+
+
+def test_connect_redis_retries_with_backoff(fake_redis, monkeypatch):
+    monkeypatch.setattr(app.warmup, "REDIS_RETRY_INITIAL_DELAY_SECONDS", 0.001)
+    ping_attempts = []
+
+    async def flaky_ping():
+        ping_attempts.append(time.monotonic())
+        if len(ping_attempts) < 3:
+            raise redis.ConnectionError("Redis еще спит")
+        return True
+
+    monkeypatch.setattr(fake_redis, "ping", flaky_ping)
+    connected_clients = []
+
+    asyncio.run(connect_redis_with_backoff(fake_redis, connected_clients.append))
+
+    assert len(ping_attempts) == 3
+    assert connected_clients == [fake_redis]
+
+
+def test_cold_start_does_not_wait_for_hung_redis(tmp_path):
+    # Redis, который принимает соединение и молчит: раньше старт ждал socket_timeout
+    hung_redis_socket = socket.socket()
+    hung_redis_socket.bind(("127.0.0.1", 0))
+    hung_redis_socket.listen(16)
+    server_port = find_free_port()
+    environment = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{tmp_path / 'startup.db'}",
+        REDIS_HOST="127.0.0.1",
+        REDIS_PORT=str(hung_redis_socket.getsockname()[1]),
+        REDIS_CONNECT_TIMEOUT_SECONDS=str(HUNG_REDIS_TIMEOUT_SECONDS),
+        REDIS_SOCKET_TIMEOUT_SECONDS=str(HUNG_REDIS_TIMEOUT_SECONDS),
+        DEBUG_MODE="False",
+    )
+
+    started_at = time.perf_counter()
+    server_process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app_instance", "--port", str(server_port), "--log-level", "warning"],
+        cwd=PROJECT_DIR,
+        env=environment,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        startup_seconds = None
+        while time.perf_counter() - started_at < STARTUP_BUDGET_SECONDS:
+            try:
+                if httpx.get(f"http://127.0.0.1:{server_port}/tasks", timeout=1).status_code == 200:
+                    startup_seconds = time.perf_counter() - started_at
+                    break
+            except httpx.TransportError:
+                pass
+            time.sleep(0.02)
+        print(f"\nСтарт до первого ответа 200: {startup_seconds} с")
+        assert startup_seconds is not None
+        assert startup_seconds < HUNG_REDIS_TIMEOUT_SECONDS
+    finally:
+        server_process.terminate()
+        server_process.wait(timeout=HUNG_REDIS_TIMEOUT_SECONDS)
+        hung_redis_socket.close()
@@ -1,4 +1,7 @@
 import pytest
+import csv
+import io
+import json
 import sys
 import os
 
@@ -34,16 +37,26 @@ app.config.app_settings = type('TestSettings', (), {
     'accent_color': "#FFB6C1",
     'ribbon_color': "#FF1493",
     'database_url': TEST_DATABASE_URL,
+    'database_async_mode': False,
+    'sqlite_pragma_profile': "performance",
     'redis_host': "localhost",
     'redis_port': 6379,
     'redis_db': 0,
     'redis_password': None,
+    'redis_max_connections': 50,
+    'redis_connect_timeout_seconds': 1.0,
+    'redis_socket_timeout_seconds': 0.5,
+    'l1_cache_max_entries': 256,
+    'l1_cache_ttl_seconds': 2.0,
+    'health_probe_interval_seconds': 10.0,
     'enable_kitty_sounds': True,
     'kitty_emoji': "🐱🎀🌸",
     'default_bow': "pink",
 })()
 
 from app.database import get_db_dependency
+from app.cache import response_cache_instance, etag_matches
+from app import crud
 app_instance.dependency_overrides[get_db_dependency] = override_get_db
 
 test_client = TestClient(app_instance)
@@ -52,6 +65,7 @@ test_client = TestClient(app_instance)
 @pytest.fixture(scope="function", autouse=True)
 def setup_test_database():
     BaseModel.metadata.create_all(bind=test_engine)
+    response_cache_instance.local_cache.clear()
     yield
     BaseModel.metadata.drop_all(bind=test_engine)
 
@@ -170,3 +184,445 @@ def test_health_check():
     response = test_client.get("/health")
     assert response.status_code == 200
     assert "status" in response.json()
+
+
+def test_cursor_pagination_walks_all_tasks(setup_test_database):
+    for i in range(5):
+        test_client.post("/tasks", json={"title": f"Задача {i}", "status": "todo"})
+
+    response = test_client.get("/tasks", params={"limit_param": 2})
+    assert response.status_code == 200
+    page = response.json()
+    seen_ids = [task["id"] for task in page["tasks"]]
+    assert page["next_cursor"]
+
+    while page["next_cursor"]:
+        response = test_client.get("/tasks", params={"limit_param": 2, "cursor_param": page["next_cursor"]})
+        assert response.status_code == 200
+        page = response.json()
+        seen_ids.extend(task["id"] for task in page["tasks"])
+
+    assert seen_ids == sorted(seen_ids)
+    assert len(seen_ids) == 5
+    assert page["total"] == 5
+
+
+def test_invalid_cursor():
+    response = test_client.get("/tasks", params={"cursor_param": "не-курсор"})
+    assert response.status_code == 400
+
+
+def test_total_follows_create_and_delete(setup_test_database):
+    created_ids = []
+    for i in range(3):
+        response = test_client.post("/tasks", json={"title": f"Задача {i}", "status": "todo"})
+        created_ids.append(response.json()["id"])
+    assert test_client.get("/tasks").json()["total"] == 3
+
+    test_client.delete(f"/tasks/{created_ids[0]}")
+    assert test_client.get("/tasks").json()["total"] == 2
+
+
+def test_list_without_total(setup_test_database):
+    test_client.post("/tasks", json={"title": "Задача", "status": "todo"})
+
+    response = test_client.get("/tasks", params={"include_total": "false"})
+    assert response.status_code == 200
+    assert response.json()["total"] is None
+    assert len(response.json()["tasks"]) == 1
+
+
+def test_bulk_create_tasks(setup_test_database):
+    bulk_data = {"tasks": [
+        {"title": f"Пакетная задача {i}", "status": "todo", "category": "home", "priority": 2}
+        for i in range(50)
+    ]}
+
+    response = test_client.post("/tasks/bulk", json=bulk_data)
+    assert response.status_code == 201
+    created = response.json()
+    assert created["created"] == 50
+    assert len(created["task_ids"]) == 50
+
+    tasks_page = test_client.get("/tasks").json()
+    assert tasks_page["total"] == 50
+    assert [task["id"] for task in tasks_page["tasks"]] == created["task_ids"]
+    assert all(task["category"] == "home" for task in tasks_page["tasks"])
+
+
+def test_bulk_create_rejects_invalid_task(setup_test_database):
+    bulk_data = {"tasks": [
+        {"title": "Нормальная задача", "status": "todo"},
+        {"title": "", "status": "todo"},
+    ]}
+
+    response = test_client.post("/tasks/bulk", json=bulk_data)
+    assert response.status_code == 422
+    assert test_client.get("/tasks").json()["total"] == 0
+
+
+def test_bulk_update_by_filter(setup_test_database):
+    test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": "Уроки", "status": "todo", "category": "school"},
+        {"title": "Реферат", "status": "in_progress", "category": "school"},
+        {"title": "Уборка", "status": "todo", "category": "home"},
+    ]})
+
+    response = test_client.patch("/tasks/bulk", json={
+        "filter": {"category": "school"},
+        "changes": {"status": "done"}
+    })
+    assert response.status_code == 200
+    assert response.json()["affected"] == 2
+
+    statuses = {task["category"]: task["status"] for task in test_client.get("/tasks").json()["tasks"]}
+    assert statuses == {"school": "done", "home": "todo"}
+
+
+def test_bulk_delete_by_filter(setup_test_database):
+    created_ids = test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": "Готово 1", "status": "done"},
+        {"title": "Готово 2", "status": "done"},
+        {"title": "В работе", "status": "in_progress"},
+        {"title": "Сделать", "status": "todo"},
+    ]}).json()["task_ids"]
+
+    response = test_client.request("DELETE", "/tasks/bulk", json={"status": "done"})
+    assert response.status_code == 200
+    assert response.json()["affected"] == 2
+
+    response = test_client.request("DELETE", "/tasks/bulk", json={"task_ids": created_ids[2:], "status": "todo"})
+    assert response.json()["affected"] == 1
+
+    remaining = test_client.get("/tasks").json()
+    assert remaining["total"] == 1
+    assert remaining["tasks"][0]["status"] == "in_progress"
+
+
+def test_bulk_delete_requires_filter(setup_test_database):
+    test_client.post("/tasks", json={"title": "Не трогать", "status": "todo"})
+
+    response = test_client.request("DELETE", "/tasks/bulk", json={})
+    assert response.status_code == 422
+    assert test_client.get("/tasks").json()["total"] == 1
+
+
+def test_filter_and_sort_tasks(setup_test_database):
+    test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": "Уроки", "status": "todo", "category": "school", "priority": 5},
+        {"title": "Реферат", "status": "todo", "category": "school", "priority": 2},
+        {"title": "Уборка", "status": "todo", "category": "home", "priority": 4},
+        {"title": "Экзамен", "status": "done", "category": "school", "priority": 3},
+    ]})
+
+    response = test_client.get("/tasks", params={
+        "status_param": "todo",
+        "category_param": "school",
+        "sort_param": "-priority"
+    })
+    assert response.status_code == 200
+    page = response.json()
+    assert [task["priority"] for task in page["tasks"]] == [5, 2]
+    assert page["total"] == 2
+
+    response = test_client.get("/tasks", params={"priority_min_param": 3, "priority_max_param": 4})
+    assert sorted(task["priority"] for task in response.json()["tasks"]) == [3, 4]
+
+    response = test_client.get("/tasks", params={"created_to_param": "2000-01-01T00:00:00"})
+    assert response.json()["tasks"] == []
+
+
+def test_cursor_requires_id_sort():
+    response = test_client.get("/tasks", params={"cursor_param": "eyJpZCI6MX0", "sort_param": "priority"})
+    assert response.status_code == 400
+
+
+def test_search_tasks(setup_test_database):
+    test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": "Купить молоко", "description": "И печенье к нему"},
+        {"title": "Печь блины", "description": "Нужно молоко и мука"},
+        {"title": "Помыть окна", "description": "Без молока"},
+    ]})
+
+    response = test_client.get("/tasks/search", params={"q": "молоко"})
+    assert response.status_code == 200
+    found = response.json()
+    assert found["total"] == 2
+    assert "Купить молоко" in found["tasks"][0]["title"]
+
+    response = test_client.get("/tasks/search", params={"q": "молок"})
+    assert response.json()["total"] == 3
+
+
+def test_search_follows_updates_and_deletes(setup_test_database):
+    task_id = test_client.post("/tasks", json={"title": "Полить цветы", "status": "todo"}).json()["id"]
+
+    test_client.patch(f"/tasks/{task_id}", json={"title": "Покормить кота"})
+    assert test_client.get("/tasks/search", params={"q": "цветы"}).json()["total"] == 0
+    assert test_client.get("/tasks/search", params={"q": "кота"}).json()["total"] == 1
+
+    test_client.delete(f"/tasks/{task_id}")
+    assert test_client.get("/tasks/search", params={"q": "кота"}).json()["total"] == 0
+
+
+def test_search_tolerates_fts_syntax(setup_test_database):
+    test_client.post("/tasks", json={"title": "Задача \"в кавычках\" AND NOT", "status": "todo"})
+
+    response = test_client.get("/tasks/search", params={"q": "\"кавычках AND ("})
+    assert response.status_code == 200
+
+
+def test_export_ndjson(setup_test_database):
+    test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": f"Экспорт {i}", "status": "done", "category": "work", "priority": 4} for i in range(2500)
+    ]})
+
+    response = test_client.get("/tasks/export", params={"format": "ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = response.text.splitlines()
+    assert len(lines) == 2500
+    first_task = json.loads(lines[0])
+    assert first_task["status"] == "done"
+    assert first_task["category"] == "work"
+    assert first_task["priority"] == 4
+    assert [json.loads(line)["id"] for line in lines] == sorted(json.loads(line)["id"] for line in lines)
+
+
+def test_export_csv(setup_test_database):
+    test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": "Задача, с запятой", "description": "Строка\nвторая строка"},
+        {"title": "Вторая"},
+    ]})
+
+    response = test_client.get("/tasks/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 2
+    assert rows[0]["title"].startswith("Задача, с запятой")
+    assert rows[0]["description"] == "Строка\nвторая строка"
+    assert rows[1]["description"] == ""
+
+
+def test_export_uses_overridden_session(setup_test_database, tmp_path):
+    export_engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}", connect_args={"check_same_thread": False})
+    BaseModel.metadata.create_all(bind=export_engine)
+    with sessionmaker(bind=export_engine)() as session:
+        session.add(crud.TaskModel(title="Из другой базы"))
+        session.commit()
+
+    def override_export_db():
+        with sessionmaker(bind=export_engine)() as session:
+            yield session
+
+    app_instance.dependency_overrides[get_db_dependency] = override_export_db
+    try:
+        response = test_client.get("/tasks/export", params={"format": "ndjson"})
+    finally:
+        app_instance.dependency_overrides[get_db_dependency] = override_get_db
+        export_engine.dispose()
+
+    assert [json.loads(line)["title"] for line in response.text.splitlines()] == ["Из другой базы"]
+
+
+def test_import_ndjson_reports_bad_rows(setup_test_database):
+    valid_lines = [json.dumps({"title": f"Импорт {i}", "priority": 2}, ensure_ascii=False) for i in range(2500)]
+    upload_lines = valid_lines[:10] + ["{не json", json.dumps({"title": ""}), "[1, 2]"] + valid_lines[10:]
+
+    response = test_client.post(
+        "/tasks/import",
+        params={"format": "ndjson"},
+        content="\n".join(upload_lines).encode("utf-8")
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 2500
+    assert report["failed"] == 3
+    assert [error["row"] for error in report["errors"]] == [11, 12, 13]
+    assert report["rows_per_second"] > 0
+
+    assert test_client.get("/tasks", params={"limit_param": 1}).json()["total"] == 2500
+
+
+def test_import_csv_round_trip(setup_test_database):
+    test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": "Задача, с запятой", "description": "Строка\n\"вторая\" строка", "category": "work"},
+        {"title": "Вторая", "priority": 5},
+    ]})
+    exported_csv = test_client.get("/tasks/export", params={"format": "csv"}).content
+
+    response = test_client.post("/tasks/import", params={"format": "csv"}, content=exported_csv)
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2
+    assert response.json()["failed"] == 0
+
+    tasks = test_client.get("/tasks").json()["tasks"]
+    assert len(tasks) == 4
+    assert tasks[2]["description"] == "Строка\n\"вторая\" строка"
+    assert tasks[2]["category"] == "work"
+    assert tasks[3]["priority"] == 5
+
+
+def test_import_csv_with_excel_bom(setup_test_database):
+    excel_csv = "title,priority\r\nИз Excel,4\r\n".encode("utf-8-sig")
+
+    response = test_client.post("/tasks/import", params={"format": "csv"}, content=excel_csv)
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
+    assert response.json()["failed"] == 0
+    assert test_client.get("/tasks").json()["tasks"][0]["title"].startswith("Из Excel")
+
+
+def test_import_splits_lines_across_chunks():
+    import asyncio
+    from app.task_import import iter_text_lines
+
+    payload = "первая\r\nвторая\nтретья".encode("utf-8")
+
+    async def byte_chunks():
+        for position in range(len(payload)):
+            yield payload[position:position + 1]
+
+    async def collect_lines():
+        return [line async for line in iter_text_lines(byte_chunks())]
+
+    assert asyncio.run(collect_lines()) == ["первая", "вторая", "третья"]
+
+
+def test_fast_serialization_matches_response_schema(setup_test_database):
+    from app.models import TaskModel
+    from app.schemas import TaskResponseSchema
+
+    created_task = test_client.post("/tasks", json={
+        "title": "Сериализация", "description": "Проверка", "status": "done", "category": "home", "priority": 5
+    }).json()
+    test_client.patch(f"/tasks/{created_task['id']}", json={"status": "done"})
+
+    database_session = TestingSessionLocal()
+    try:
+        task_instance = database_session.get(TaskModel, created_task["id"])
+        expected_task = TaskResponseSchema.from_orm(task_instance).model_dump(mode="json")
+    finally:
+        database_session.close()
+
+    assert test_client.get(f"/tasks/{created_task['id']}").json() == expected_task
+    assert test_client.get("/tasks").json()["tasks"] == [expected_task]
+    assert test_client.get("/tasks/search", params={"q": "Сериализация"}).json()["tasks"] == [expected_task]
+
+
+def test_sparse_fieldsets(setup_test_database):
+    created_task = test_client.post("/tasks", json={
+        "title": "Поля", "description": "Длинное описание " * 20, "status": "in_progress", "priority": 4
+    }).json()
+
+    response = test_client.get("/tasks", params={"fields": "title,status"})
+    assert response.status_code == 200
+    assert response.json()["tasks"] == [
+        {"id": created_task["id"], "title": created_task["title"], "status": "in_progress"}
+    ]
+
+    response = test_client.get(f"/tasks/{created_task['id']}", params={"fields": "priority"})
+    assert response.status_code == 200
+    assert response.json() == {"id": created_task["id"], "priority": 4}
+
+    assert test_client.get(f"/tasks/{created_task['id']}").json() == created_task
+    assert test_client.get("/tasks", params={"fields": "title,secret"}).status_code == 400
+    assert test_client.get(f"/tasks/{created_task['id']}", params={"fields": "secret"}).status_code == 400
+    assert test_client.get("/tasks/999999", params={"fields": "title"}).status_code == 404
+
+
+def test_sparse_fieldsets_keep_cursor(setup_test_database):
+    test_client.post("/tasks/bulk", json={"tasks": [{"title": f"Курсор {i}"} for i in range(5)]})
+
+    first_page = test_client.get("/tasks", params={"fields": "title", "limit_param": 3}).json()
+    assert all(set(task) == {"id", "title"} for task in first_page["tasks"])
+    second_page = test_client.get(
+        "/tasks", params={"fields": "title", "limit_param": 3, "cursor_param": first_page["next_cursor"]}
+    ).json()
+    assert len(second_page["tasks"]) == 2
+
+
+def test_tasks_stats(setup_test_database):
+    empty_stats = test_client.get("/tasks/stats").json()
+    assert empty_stats["total"] == 0
+    assert empty_stats["completion_rate"] == 0.0
+
+    test_client.post("/tasks/bulk", json={"tasks": [
+        {"title": "Первая", "status": "done", "category": "work", "priority": 5},
+        {"title": "Вторая", "status": "done", "category": "home", "priority": 5},
+        {"title": "Третья", "status": "in_progress", "category": "work", "priority": 1},
+        {"title": "Четвертая", "status": "todo", "category": "work", "priority": 2},
+    ]})
+
+    response = test_client.get("/tasks/stats")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total"] == 4
+    assert stats["completed"] == 2
+    assert stats["pending"] == 2
+    assert stats["completion_rate"] == 0.5
+    assert stats["by_status"] == {"todo": 1, "in_progress": 1, "done": 2}
+    assert stats["by_category"]["work"] == 3
+    assert stats["by_category"]["shopping"] == 0
+    assert stats["by_priority"] == {"1": 1, "2": 1, "3": 0, "4": 0, "5": 2}
+
+
+def test_list_etag_returns_304_until_write(setup_test_database, monkeypatch):
+    test_client.post("/tasks", json={"title": "ETag"})
+
+    first_response = test_client.get("/tasks")
+    etag = first_response.headers["etag"]
+    assert first_response.headers["cache-control"] == "no-cache"
+    assert test_client.get("/tasks", params={"fields": "title"}).headers["etag"] != etag
+
+    def fail_on_database_access(*args, **kwargs):
+        raise AssertionError("304 не должен читать базу")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(crud.TaskCRUD, "get_all_tasks", staticmethod(fail_on_database_access))
+        patch.setattr(crud.TaskCRUD, "count_tasks", staticmethod(fail_on_database_access))
+        not_modified = test_client.get("/tasks", headers={"If-None-Match": f'"other", {etag}'})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    test_client.post("/tasks", json={"title": "Еще одна"})
+    changed = test_client.get("/tasks", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()["tasks"]) == 2
+
+
+def test_single_task_and_stats_etags(setup_test_database):
+    task_id = test_client.post("/tasks", json={"title": "ETag задачи"}).json()["id"]
+
+    etag = test_client.get(f"/tasks/{task_id}").headers["etag"]
+    assert test_client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag}).status_code == 304
+
+    stats_etag = test_client.get("/tasks/stats").headers["etag"]
+    assert test_client.get("/tasks/stats", headers={"If-None-Match": stats_etag}).status_code == 304
+
+    test_client.patch(f"/tasks/{task_id}", json={"status": "done"})
+    response = test_client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["status"] == "done"
+    assert test_client.get("/tasks/stats", headers={"If-None-Match": stats_etag}).json()["completed"] == 1
+
+
+
+def test_wildcard_etag_does_not_hide_missing_task(setup_test_database):
+    assert test_client.get("/tasks/99999", headers={"If-None-Match": "*"}).status_code == 404
+
+    task_id = test_client.post("/tasks", json={"title": "Существующая задача"}).json()["id"]
+    assert test_client.get(f"/tasks/{task_id}", headers={"If-None-Match": "*"}).status_code == 304
+
+def test_etag_matching_rules():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+    assert not etag_matches('W/"abcd"', 'W/"abc"')
@@ -0,0 +1,101 @@
+import asyncio
+import multiprocessing
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+import app.crud
+import app.main
+from app.cache import LocalLRUCache, ResponseCache
+from app.crud import async_task_crud_instance, run_crud_write_method, TaskCRUD, SQLITE_WRITE_RETRY_ATTEMPTS
+from app.database import BaseModel, database_engine, SessionLocal
+
+
+def bump_in_child(response_cache):
+    response_cache.bump_local_generation()
+
+
+def test_local_generation_is_shared_with_forked_workers():
+    response_cache = ResponseCache(LocalLRUCache(16, 60.0))
+    key_before = asyncio.run(response_cache.current_list_key("page"))
+
+    worker_process = multiprocessing.get_context("fork").Process(target=bump_in_child, args=(response_cache,))
+    worker_process.start()
+    worker_process.join()
+
+    assert worker_process.exitcode == 0
+    assert response_cache.local_generation == 1
+    assert asyncio.run(response_cache.current_list_key("page")) != key_before
+
+
+def build_locked_error():
+    return OperationalError("INSERT INTO kitty_tasks", {}, Exception("database is locked"))
+
+
+def test_write_retries_when_another_process_holds_the_lock(monkeypatch):
+    monkeypatch.setattr(app.crud, "SQLITE_WRITE_RETRY_BASE_DELAY_SECONDS", 0.001)
+    attempts = []
+
+    def flaky_write(database_session):
+        attempts.append(database_session)
+        if len(attempts) < 3:
+            raise build_locked_error()
+        return "записано"
+
+    assert asyncio.run(run_crud_write_method(object(), flaky_write)) == "записано"
+    assert len(attempts) == 3
+
+
+def test_write_gives_up_after_retry_limit(monkeypatch):
+    monkeypatch.setattr(app.crud, "SQLITE_WRITE_RETRY_BASE_DELAY_SECONDS", 0.001)
+    attempts = []
+
+    def locked_write(database_session):
+        attempts.append(database_session)
+        raise build_locked_error()
+
+    with pytest.raises(OperationalError):
+        asyncio.run(run_crud_write_method(object(), locked_write))
+    assert len(attempts) == SQLITE_WRITE_RETRY_ATTEMPTS
+
+
+def test_workers_skip_database_preparation_done_by_master(monkeypatch):
+    preparation_calls = []
+    monkeypatch.setattr(app.main, "prepare_database_schema", lambda: preparation_calls.append("schema"))
+
+    async def reconcile_in_background():
+        preparation_calls.append("reconcile")
+
+    monkeypatch.setattr(app.main, "reconcile_task_counter_in_background", reconcile_in_background)
+    monkeypatch.setattr(app.main, "database_prepared", True)
+
+    with TestClient(app.main.app_instance):
+        pass
+
+    assert preparation_calls == []
+
+
+def test_count_without_counter_row_reconciles_through_write_path(monkeypatch):
+    BaseModel.metadata.create_all(bind=database_engine)
+    write_methods = []
+
+    async def recording_write_method(database_session, crud_method, *args):
+        write_methods.append(crud_method)
+        return await run_crud_write_method(database_session, crud_method, *args)
+
+    monkeypatch.setattr(app.crud, "run_crud_write_method", recording_write_method)
+    database_session = SessionLocal()
+    try:
+        assert TaskCRUD.count_tasks(database_session) is None
+        assert asyncio.run(async_task_crud_instance.count_tasks(database_session)) == 0
+        assert asyncio.run(async_task_crud_instance.count_tasks(database_session)) == 0
+    finally:
+        database_session.close()
+        BaseModel.metadata.drop_all(bind=database_engine)
+
+    assert write_methods == [TaskCRUD.reconcile_task_counter]